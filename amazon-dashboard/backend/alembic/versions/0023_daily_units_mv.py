@@ -0,0 +1,57 @@
+"""Daily units materialized view for timeseries.
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-16
+
+Creates daily_units_mv: SUM(order_items.units) per (sku, marketplace, order_date), so
+end-date and daily-units lookups read pre-aggregated rows instead of raw order_items.
+The unique index allows REFRESH MATERIALIZED VIEW CONCURRENTLY (see refresh_daily_units).
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0023"
+down_revision = "0022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW daily_units_mv AS
+        SELECT
+            oi.sku,
+            oi.marketplace_id,
+            m.code AS marketplace_code,
+            oi.order_date,
+            SUM(oi.units)::bigint AS units
+        FROM order_items oi
+        JOIN marketplaces m ON m.id = oi.marketplace_id
+        GROUP BY oi.sku, oi.marketplace_id, m.code, oi.order_date
+        """
+    )
+    op.create_index(
+        "uq_daily_units_mv_sku_marketplace_date",
+        "daily_units_mv",
+        ["sku", "marketplace_id", "order_date"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_daily_units_mv_marketplace_code_date",
+        "daily_units_mv",
+        ["marketplace_code", "order_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_daily_units_mv_order_date",
+        "daily_units_mv",
+        ["order_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS daily_units_mv")
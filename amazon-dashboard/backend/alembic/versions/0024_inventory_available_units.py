@@ -0,0 +1,42 @@
+"""Inventory available_units as a stored generated column.
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-16
+
+Adds inventory_levels.available_units = GREATEST(on_hand_units - COALESCE(reserved_units, 0), 0),
+computed by Postgres on write, plus an index on (sku, marketplace, available_units) for
+low-stock scans. Freshness stays in Python: now() is not allowed in a generated column.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0024"
+down_revision = "0023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "inventory_levels",
+        sa.Column(
+            "available_units",
+            sa.Numeric(14, 2),
+            sa.Computed("GREATEST(on_hand_units - COALESCE(reserved_units, 0), 0)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_inventory_levels_sku_mp_available",
+        "inventory_levels",
+        ["sku", "marketplace", "available_units"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inventory_levels_sku_mp_available", table_name="inventory_levels")
+    op.drop_column("inventory_levels", "available_units")
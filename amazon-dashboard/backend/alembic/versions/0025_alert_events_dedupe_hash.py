@@ -0,0 +1,49 @@
+"""Alert events: dedupe on a 64-bit hash instead of the dedupe_key string.
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-16
+
+Adds alert_events.dedupe_hash BIGINT NOT NULL UNIQUE (signed big-endian blake2b-64 of
+dedupe_key, see alerts_service._dedupe_hash) and moves the unique constraint off the
+VARCHAR dedupe_key, which stays as a nullable, unindexed column for debugging.
+"""
+from __future__ import annotations
+
+from hashlib import blake2b
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0025"
+down_revision = "0024"
+branch_labels = None
+depends_on = None
+
+
+def _dedupe_hash(key: str) -> int:
+    # Must match app.services.alerts_service._dedupe_hash.
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+def upgrade() -> None:
+    op.add_column("alert_events", sa.Column("dedupe_hash", sa.BigInteger(), nullable=True))
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, dedupe_key FROM alert_events")).all()
+    if rows:
+        conn.execute(
+            sa.text("UPDATE alert_events SET dedupe_hash = :h WHERE id = :id"),
+            [{"id": r.id, "h": _dedupe_hash(r.dedupe_key)} for r in rows],
+        )
+    op.alter_column("alert_events", "dedupe_hash", nullable=False)
+    op.create_unique_constraint("uq_alert_events_dedupe_hash", "alert_events", ["dedupe_hash"])
+    op.drop_constraint("uq_alert_events_dedupe_key", "alert_events", type_="unique")
+    op.alter_column("alert_events", "dedupe_key", existing_type=sa.String(length=255), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM alert_events WHERE dedupe_key IS NULL")
+    op.alter_column("alert_events", "dedupe_key", existing_type=sa.String(length=255), nullable=False)
+    op.create_unique_constraint("uq_alert_events_dedupe_key", "alert_events", ["dedupe_key"])
+    op.drop_constraint("uq_alert_events_dedupe_hash", "alert_events", type_="unique")
+    op.drop_column("alert_events", "dedupe_hash")
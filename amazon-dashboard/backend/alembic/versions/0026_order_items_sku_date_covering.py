@@ -0,0 +1,41 @@
+"""order_items: covering (sku, order_date) index for per-SKU demand reads.
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-16
+
+Replaces ix_order_items_sku_order_date (0022) with the same key plus INCLUDE (units,
+marketplace_id), so the per-SKU mapped-demand aggregation (sku = ?, order_date range, join
+to marketplaces on marketplace_id, SUM(units)) can be answered by an index-only scan.
+The (order_date) index for the total path already exists (ix_order_items_order_date).
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0026"
+down_revision = "0025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_order_items_sku_date_covering",
+        "order_items",
+        ["sku", "order_date"],
+        unique=False,
+        postgresql_include=["units", "marketplace_id"],
+    )
+    # Same leading key: the covering index serves every lookup the old one did.
+    op.drop_index("ix_order_items_sku_order_date", table_name="order_items")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_order_items_sku_order_date",
+        "order_items",
+        ["sku", "order_date"],
+        unique=False,
+    )
+    op.drop_index("ix_order_items_sku_date_covering", table_name="order_items")
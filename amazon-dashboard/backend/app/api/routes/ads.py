@@ -32,8 +32,6 @@ from app.schemas.ads_attribution import (
     SkuCostCreate,
     SkuCostResponse,
     SkuProfitabilityResponse,
-    SkuProfitabilityRow,
-    SkuTimeseriesPoint,
     SkuTimeseriesResponse,
 )
 from app.services.amazon_ads_sync import run_ads_sync
@@ -291,26 +289,7 @@ def get_attribution_sku_profitability(
     )
     _validate_marketplace(db, marketplace)
     rows = get_sku_profitability(db, days=days, marketplace=marketplace)
-    schema_rows = [
-        SkuProfitabilityRow(
-            sku=r.sku,
-            marketplace_code=r.marketplace_code,
-            revenue=r.revenue,
-            ad_spend=r.ad_spend,
-            attributed_sales=r.attributed_sales,
-            organic_sales=r.organic_sales,
-            units_sold=r.units_sold,
-            unit_cogs=r.unit_cogs,
-            total_cogs=r.total_cogs,
-            gross_profit=r.gross_profit,
-            net_profit=r.net_profit,
-            acos=r.acos,
-            roas=r.roas,
-            warning_flags=r.warning_flags,
-        )
-        for r in rows
-    ]
-    return SkuProfitabilityResponse(days=days, marketplace=marketplace, rows=schema_rows)
+    return SkuProfitabilityResponse(days=days, marketplace=marketplace, rows=rows)
 
 
 @router.get("/attribution/sku-timeseries", response_model=SkuTimeseriesResponse)
@@ -328,18 +307,7 @@ def get_attribution_sku_timeseries(
     )
     _validate_marketplace(db, marketplace)
     points = get_sku_profitability_timeseries(db, sku=sku, days=days, marketplace=marketplace)
-    schema_points = [
-        SkuTimeseriesPoint(
-            date=p.date,
-            revenue=p.revenue,
-            ad_spend=p.ad_spend,
-            attributed_sales=p.attributed_sales,
-            net_profit=p.net_profit,
-            units=p.units,
-        )
-        for p in points
-    ]
-    return SkuTimeseriesResponse(sku=sku, days=days, marketplace=marketplace, points=schema_points)
+    return SkuTimeseriesResponse(sku=sku, days=days, marketplace=marketplace, points=points)
 
 
 # --- SKU cost (COGS) CRUD: owner-only for write, any auth for read ---
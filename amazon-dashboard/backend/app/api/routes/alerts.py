@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 
 from app.api.deps.permissions import require_owner
 from app.api.routes.me import get_current_user
+from app.core.responses import model_json_response
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.alerts import (
@@ -29,18 +31,7 @@ router = APIRouter()
 
 def _event_to_response(event) -> AlertEventResponse:
     """Build AlertEventResponse from AlertEvent model."""
-    return AlertEventResponse(
-        id=event.id,
-        alert_type=event.alert_type,
-        severity=event.severity,
-        sku=event.sku,
-        marketplace=event.marketplace,
-        title=event.title,
-        message=event.message,
-        is_acknowledged=event.is_acknowledged,
-        acknowledged_at=event.acknowledged_at,
-        created_at=event.created_at,
-    )
+    return AlertEventResponse.from_orm_trusted(event)
 
 
 @router.get("/alerts", response_model=AlertListResponse)
@@ -50,7 +41,7 @@ def get_alerts(
     limit: int = Query(default=200, ge=1, le=500),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> AlertListResponse:
+) -> Response:
     """List alert events with optional filters."""
     items = list_alerts(
         db,
@@ -58,7 +49,9 @@ def get_alerts(
         unacknowledged_only=unacknowledged,
         limit=limit,
     )
-    return AlertListResponse(items=[_event_to_response(e) for e in items])
+    return model_json_response(
+        AlertListResponse.model_construct(items=[_event_to_response(e) for e in items])
+    )
 
 
 @router.post("/alerts/ack")
@@ -79,16 +72,7 @@ def get_alerts_settings(
 ) -> AlertSettingsResponse:
     """Get alert/email settings (single row id=1)."""
     row = get_or_create_settings(db)
-    return AlertSettingsResponse(
-        email_enabled=row.email_enabled,
-        email_recipients=row.email_recipients,
-        send_inventory_stale=row.send_inventory_stale,
-        send_urgent_restock=row.send_urgent_restock,
-        send_reorder_soon=row.send_reorder_soon,
-        send_order_by_passed=row.send_order_by_passed,
-        stale_days_threshold=row.stale_days_threshold,
-        updated_at=row.updated_at,
-    )
+    return AlertSettingsResponse.from_orm_trusted(row)
 
 
 @router.put("/alerts/settings", response_model=AlertSettingsResponse)
@@ -112,16 +96,7 @@ def put_alerts_settings(
         metadata=patch,
     )
     db.commit()
-    return AlertSettingsResponse(
-        email_enabled=row.email_enabled,
-        email_recipients=row.email_recipients,
-        send_inventory_stale=row.send_inventory_stale,
-        send_urgent_restock=row.send_urgent_restock,
-        send_reorder_soon=row.send_reorder_soon,
-        send_order_by_passed=row.send_order_by_passed,
-        stale_days_threshold=row.stale_days_threshold,
-        updated_at=row.updated_at,
-    )
+    return AlertSettingsResponse.from_orm_trusted(row)
 
 
 @router.post("/alerts/run")
@@ -129,8 +104,8 @@ def post_alerts_run(
     user: User = Depends(require_owner),
     db: Session = Depends(get_db),
 ) -> dict:
-    """Trigger alert generation once (owner only). Returns created/emailed counts."""
-    result = run_alert_generation_once(db)
+    """Trigger alert generation once (owner only). Returns created/emailed/email_queued counts."""
+    result = run_alert_generation_once(db, background_email=True)
     write_audit_log(
         db,
         actor_user_id=user.id,
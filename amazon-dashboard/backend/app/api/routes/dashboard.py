@@ -62,16 +62,17 @@ def dashboard_summary(
         )
     ad_row = db.execute(ad_q).one()
 
+    # Subtract the exact NUMERIC sums, then convert once (matches the timeseries float fields).
     revenue = Decimal(str(order_row.revenue))
     ad_spend = Decimal(str(ad_row.spend))
-    net_profit_placeholder = revenue - ad_spend
 
-    result = DashboardSummary(
-        revenue=revenue,
+    # Values are already the schema's types (float/int), so skip validation.
+    result = DashboardSummary.model_construct(
+        revenue=float(revenue),
         units=int(order_row.units),
         orders=int(order_row.orders),
-        ad_spend=ad_spend,
-        net_profit_placeholder=net_profit_placeholder,
+        ad_spend=float(ad_spend),
+        net_profit_placeholder=float(revenue - ad_spend),
     )
     cache_set(cache_key, result)
     return result
\ No newline at end of file
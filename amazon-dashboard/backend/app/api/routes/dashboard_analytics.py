@@ -3,10 +3,12 @@ from __future__ import annotations
 from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.api.routes.me import get_current_user
+from app.core.responses import model_json_response
 from app.db.session import get_db
 from app.models.ad_spend_daily import AdSpendDaily
 from app.models.marketplace import Marketplace
@@ -14,9 +16,9 @@ from app.models.order_item import OrderItem
 from app.models.product import Product
 from app.models.user import User
 from app.schemas.dashboard_timeseries import (
-    DashboardTimeseriesPoint,
+    TIMESERIES_POINTS_ADAPTER,
+    TOP_PRODUCTS_ADAPTER,
     DashboardTimeseriesResponse,
-    TopProductRow,
     TopProductsResponse,
 )
 
@@ -43,7 +45,7 @@ def dashboard_timeseries(
     marketplace: str = Query(default="ALL"),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> DashboardTimeseriesResponse:
+) -> Response:
     _validate_marketplace(db, marketplace)
     end_date = date.today()
     start_date = end_date - timedelta(days=days - 1)
@@ -83,7 +85,7 @@ def dashboard_timeseries(
         )
     ad_rows = {row.date: float(row.spend) for row in db.execute(ad_q).all()}
 
-    points: list[DashboardTimeseriesPoint] = []
+    points: list[dict] = []
     for d in date_list:
         order_row = order_rows.get(d)
         revenue = float(order_row.revenue) if order_row else 0.0
@@ -92,17 +94,23 @@ def dashboard_timeseries(
         ad_spend = ad_rows.get(d, 0.0)
         net_profit_placeholder = revenue - ad_spend
         points.append(
-            DashboardTimeseriesPoint(
-                date=d,
-                revenue=revenue,
-                units=units,
-                orders=orders,
-                ad_spend=ad_spend,
-                net_profit_placeholder=net_profit_placeholder,
-            )
+            {
+                "date": d,
+                "revenue": revenue,
+                "units": units,
+                "orders": orders,
+                "ad_spend": ad_spend,
+                "net_profit_placeholder": net_profit_placeholder,
+            }
         )
 
-    return DashboardTimeseriesResponse(days=days, marketplace=marketplace, points=points)
+    return model_json_response(
+        DashboardTimeseriesResponse(
+            days=days,
+            marketplace=marketplace,
+            points=TIMESERIES_POINTS_ADAPTER.validate_python(points),
+        )
+    )
 
 
 @router.get("/dashboard/top-products", response_model=TopProductsResponse)
@@ -112,7 +120,7 @@ def dashboard_top_products(
     limit: int = Query(default=10, ge=1, le=50),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> TopProductsResponse:
+) -> Response:
     _validate_marketplace(db, marketplace)
     end_date = date.today()
     start_date = end_date - timedelta(days=days - 1)
@@ -140,16 +148,20 @@ def dashboard_top_products(
         )
 
     rows = db.execute(q).all()
-    products = [
-        TopProductRow(
-            sku=row.sku,
-            title=row.title,
-            asin=row.asin,
-            revenue=float(row.revenue),
-            units=int(row.units),
-            orders=int(row.orders),
-        )
-        for row in rows
-    ]
+    products = TOP_PRODUCTS_ADAPTER.validate_python(
+        [
+            {
+                "sku": row.sku,
+                "title": row.title,
+                "asin": row.asin,
+                "revenue": float(row.revenue),
+                "units": int(row.units),
+                "orders": int(row.orders),
+            }
+            for row in rows
+        ]
+    )
 
-    return TopProductsResponse(days=days, marketplace=marketplace, limit=limit, products=products)
+    return model_json_response(
+        TopProductsResponse(days=days, marketplace=marketplace, limit=limit, products=products)
+    )
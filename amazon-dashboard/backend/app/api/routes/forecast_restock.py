@@ -16,7 +16,7 @@ from app.models.user import User
 from app.schemas.data_quality import DataQuality
 from app.schemas.forecast_restock import ForecastRestockPlanResponse
 from app.services.demand_source import get_demand_series_for_restock_sku
-from app.services.forecasting import _series_from_points, seasonal_naive_weekly
+from app.services.forecasting import dense_history_array, seasonal_naive_dense_values
 from app.services.inventory_service import (
     freshness_from_timestamp,
     get_inventory,
@@ -84,15 +84,16 @@ def forecast_restock_plan(
     actual_list, meta = get_demand_series_for_restock_sku(
         db, sku, marketplace, start_date, end_date, include_unmapped=include_unmapped
     )
-    series = _series_from_points(actual_list)
-    if series.empty or len(series) < 8:
+    if len(actual_list) < 8:
         raise HTTPException(
             status_code=400,
             detail="Insufficient order history for this SKU to generate forecast.",
         )
 
-    forecast_series = seasonal_naive_weekly(series, horizon_days)
-    avg_daily_forecast_units = float(forecast_series.mean()) if forecast_series.notna().any() else 0.0
+    forecast_values = seasonal_naive_dense_values(
+        dense_history_array(actual_list, start_date, end_date), horizon_days
+    )
+    avg_daily_forecast_units = float(forecast_values.mean()) if len(forecast_values) else 0.0
     forecast_units_lead_time = avg_daily_forecast_units * lead_time_days
     safety_stock_units = forecast_units_lead_time * service_level
     demand_with_buffer = forecast_units_lead_time + safety_stock_units
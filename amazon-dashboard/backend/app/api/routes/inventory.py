@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 from math import ceil
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi.responses import Response
+from sqlalchemy import Row, func, select
 from sqlalchemy.orm import Session
 
 from app.api.routes.me import get_current_user
+from app.core.responses import model_json_response
 from app.db.session import get_db
 from app.models.inventory import InventoryLevel
 from app.models.inventory_snapshot import InventorySnapshot
@@ -19,8 +21,8 @@ from app.schemas.inventory import (
     InventoryItemResponse,
     InventoryListResponse,
     InventoryUpsertRequest,
+    RESTOCK_ROWS_ADAPTER,
     RestockResponse,
-    RestockRow,
 )
 from app.services.inventory_service import (
     delete_inventory,
@@ -36,18 +38,21 @@ from app.services.inventory_service import (
 router = APIRouter()
 
 
-def _inventory_item_response(row: InventoryLevel) -> InventoryItemResponse:
-    fd = freshness_days(row.updated_at)
+def _inventory_item_response(
+    row: InventoryLevel | Row, now: datetime | None = None
+) -> InventoryItemResponse:
+    fd = freshness_days(row.updated_at, now)
     # Phase 11.4: use as_of_at when present else updated_at for hour-based freshness
     ts = row.as_of_at if row.as_of_at is not None else row.updated_at
-    freshness_status, age_hours = freshness_from_timestamp(ts)
+    freshness_status, age_hours = freshness_from_timestamp(ts, now)
     as_of_str = row.as_of_at.isoformat() if row.as_of_at is not None else None
-    return InventoryItemResponse(
+    # Trusted DB row + server-computed values: skip re-validation.
+    return InventoryItemResponse.model_construct(
         sku=row.sku,
         marketplace=row.marketplace,
         on_hand_units=float(row.on_hand_units),
         reserved_units=float(row.reserved_units or 0),
-        available_units=row.available_units(),
+        available_units=float(row.available_units),
         source=row.source,
         note=row.note,
         updated_at=row.updated_at.isoformat(),
@@ -67,10 +72,15 @@ def inventory_list(
     limit: int = Query(default=200, ge=1, le=500),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> InventoryListResponse:
+) -> Response:
     """GET /api/inventory — list inventory levels with optional filters."""
     rows = list_inventory(db, marketplace=marketplace, q=q, limit=limit)
-    return InventoryListResponse(items=[_inventory_item_response(r) for r in rows])
+    now = datetime.now(timezone.utc)
+    return model_json_response(
+        InventoryListResponse.model_construct(
+            items=[_inventory_item_response(r, now) for r in rows]
+        )
+    )
 
 
 @router.get("/inventory/{marketplace}/{sku}", response_model=InventoryItemResponse)
@@ -132,7 +142,7 @@ def restock(
     limit: int = Query(default=50, ge=1, le=200),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> RestockResponse:
+) -> Response:
     # A) Validate marketplace
     marketplace_id: int | None = None
     if marketplace != "ALL":
@@ -199,12 +209,14 @@ def restock(
         if sku not in source_by_sku:
             source_by_sku[sku] = None
     if not all_skus:
-        return RestockResponse(
-            days=days,
-            target_days=target_days,
-            marketplace=marketplace,
-            limit=limit,
-            items=[],
+        return model_json_response(
+            RestockResponse(
+                days=days,
+                target_days=target_days,
+                marketplace=marketplace,
+                limit=limit,
+                items=[],
+            )
         )
 
     # Products: title, asin per SKU
@@ -216,7 +228,7 @@ def restock(
     }
 
     # Build rows: avg_daily_units, on_hand, days_of_cover, reorder_qty, risk_level
-    rows: list[RestockRow] = []
+    rows: list[dict] = []
     for sku in all_skus:
         total_units = total_units_by_sku.get(sku, 0)
         avg_daily_units = total_units / days if days else 0.0
@@ -237,35 +249,37 @@ def restock(
         title = info.get("title")
         asin = info.get("asin")
         rows.append(
-            RestockRow(
-                sku=sku,
-                title=title,
-                asin=asin,
-                on_hand=on_hand,
-                avg_daily_units=round(avg_daily_units, 4),
-                days_of_cover=round(days_of_cover, 2),
-                reorder_qty=reorder_qty,
-                risk_level=risk_level,
-                inventory_source=source_by_sku.get(sku),
-            )
+            {
+                "sku": sku,
+                "title": title,
+                "asin": asin,
+                "on_hand": on_hand,
+                "avg_daily_units": round(avg_daily_units, 4),
+                "days_of_cover": round(days_of_cover, 2),
+                "reorder_qty": reorder_qty,
+                "risk_level": risk_level,
+                "inventory_source": source_by_sku.get(sku),
+            }
         )
 
     # H) Sort: CRITICAL first, then LOW, then OK; within each days_of_cover asc, then reorder_qty desc
     risk_order = {RISK_CRITICAL: 0, RISK_LOW: 1, RISK_OK: 2}
     rows.sort(
         key=lambda r: (
-            risk_order[r.risk_level],
-            r.days_of_cover,
-            -r.reorder_qty,
+            risk_order[r["risk_level"]],
+            r["days_of_cover"],
+            -r["reorder_qty"],
         )
     )
 
-    # I) Limit
-    items = rows[:limit]
-    return RestockResponse(
-        days=days,
-        target_days=target_days,
-        marketplace=marketplace,
-        limit=limit,
-        items=items,
+    # I) Limit (validate only the rows we return)
+    items = RESTOCK_ROWS_ADAPTER.validate_python(rows[:limit])
+    return model_json_response(
+        RestockResponse(
+            days=days,
+            target_days=target_days,
+            marketplace=marketplace,
+            limit=limit,
+            items=items,
+        )
     )
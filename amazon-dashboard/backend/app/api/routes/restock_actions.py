@@ -1,50 +1,80 @@
-"""Restock Actions API: GET /restock/actions/total and GET /restock/actions/sku/{sku}."""
+"""Restock Actions API: GET /restock/actions/total, GET /restock/actions/sku/{sku}, POST /restock/actions/skus."""
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+import asyncio
+from datetime import date, datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.routes.forecast import _validate_marketplace
 from app.api.routes.me import get_current_user
-from app.db.session import get_db
+from app.core.responses import model_json_response
+from app.db.session import AsyncSessionLocal, get_async_db
 from app.models.marketplace import Marketplace
 from app.models.user import User
 from app.schemas.restock_actions import (
     DemandRangeDaily,
     RestockActionItem,
+    RestockActionsBulkRequest,
+    RestockActionsBulkResponse,
     RestockActionsResponse,
 )
 from app.services.forecasting import (
-    _series_from_points,
-    backtest_30d,
-    seasonal_naive_weekly,
+    snaive_backtest_and_forecast,
+    units_from_points,
 )
 from app.schemas.data_quality import DataQuality
 from app.services.demand_source import (
-    get_demand_series_for_restock_sku,
     get_demand_series_for_restock_total,
+    restock_meta_for_sku_series,
 )
 from app.services.forecast_intelligence import build_intelligence
-from app.services.inventory_service import freshness_from_timestamp, get_inventory
+from app.services.inventory_service import freshness_from_timestamp
 from app.services.restock_actions import compute_restock_action
-from app.services.timeseries import get_data_end_date_sku, get_data_end_date_total
+from app.services.timeseries import (
+    SkuBundle,
+    SkuInventoryRow,
+    fetch_sku_bundle,
+    fetch_sku_bundles,
+    get_data_end_date_total,
+)
 
 router = APIRouter()
 
 HISTORY_DAYS = 180
 
 
-def _forecast_total_for_restock(
+async def _run_with_marketplace_check(db: AsyncSession, marketplace: str, fn, *args, **kwargs):
+    """
+    Run sync query helper `fn` on `db` while the marketplace code is validated on a second
+    pooled session, so the two round-trips overlap. An invalid marketplace still wins (400).
+    """
+    if marketplace == "ALL":
+        return await db.run_sync(fn, *args, **kwargs)
+    async with AsyncSessionLocal() as check_db:
+        checked, result = await asyncio.gather(
+            check_db.run_sync(_validate_marketplace, marketplace),
+            db.run_sync(fn, *args, **kwargs),
+            return_exceptions=True,
+        )
+    for outcome in (checked, result):
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return result
+
+
+def _total_demand_for_restock(
     db: Session,
     marketplace: str,
-    horizon_days: int,
     *,
     include_unmapped: bool = False,
 ):
-    """Reuse forecast total logic with demand_source (Phase 12.3)."""
+    """Load total demand (Phase 12.3). Sync; runs via AsyncSession.run_sync."""
     end_date = get_data_end_date_total(db, marketplace)
     if end_date is None:
         end_date = date.today()
@@ -52,13 +82,21 @@ def _forecast_total_for_restock(
     actual_list, meta = get_demand_series_for_restock_total(
         db, marketplace, start_date, end_date, include_unmapped=include_unmapped
     )
-    mae_30d, mape_30d, _ = backtest_30d(actual_list, use_seasonal_naive=True)
-    series = _series_from_points(actual_list)
-    forecast_series = seasonal_naive_weekly(series, horizon_days)
-    forecast_expected_total = float(forecast_series.sum())
-    history_daily_units = [float(u) for _, u in actual_list]
+    return end_date, actual_list, meta
+
+
+def _forecast_for_restock(
+    end_date: date,
+    actual_list: list[tuple[date, int]],
+    meta,
+    horizon_days: int,
+):
+    """Backtest, seasonal naive forecast and intelligence for one demand series (CPU only, no DB)."""
+    # One pass over actual_list; backtest, forecast and intelligence share the dense units array.
+    units_arr = units_from_points(actual_list)
+    mae_30d, mape_30d, forecast_expected_total = snaive_backtest_and_forecast(units_arr, horizon_days)
     intelligence_result = build_intelligence(
-        history_daily_units=history_daily_units,
+        history_daily_units=units_arr,
         forecast_expected_total=forecast_expected_total,
         horizon_days=horizon_days,
         mape_30d=mape_30d,
@@ -74,40 +112,20 @@ def _forecast_total_for_restock(
 
 
 def _forecast_sku_for_restock(
-    db: Session,
+    bundle: SkuBundle,
     sku: str,
-    marketplace: str,
     horizon_days: int,
     *,
     include_unmapped: bool = False,
 ):
-    """Reuse forecast SKU logic with demand_source (Phase 12.3)."""
-    end_date = get_data_end_date_sku(db, sku, marketplace)
-    if end_date is None:
+    """Reuse forecast SKU logic with demand_source (Phase 12.3) on a prefetched SkuBundle."""
+    end_date = bundle.end_date
+    if end_date is None or bundle.meta is None:
         return None
-    start_date = end_date - timedelta(days=HISTORY_DAYS - 1)
-    actual_list, meta = get_demand_series_for_restock_sku(
-        db, sku, marketplace, start_date, end_date, include_unmapped=include_unmapped
-    )
-    mae_30d, mape_30d, _ = backtest_30d(actual_list, use_seasonal_naive=True)
-    series = _series_from_points(actual_list)
-    forecast_series = seasonal_naive_weekly(series, horizon_days)
-    forecast_expected_total = float(forecast_series.sum())
-    history_daily_units = [float(u) for _, u in actual_list]
-    intelligence_result = build_intelligence(
-        history_daily_units=history_daily_units,
-        forecast_expected_total=forecast_expected_total,
-        horizon_days=horizon_days,
-        mape_30d=mape_30d,
-        lead_time_days=None,
-        current_stock_units=None,
+    meta = restock_meta_for_sku_series(
+        sku, bundle.series, bundle.meta, include_unmapped=include_unmapped
     )
-    return {
-        "end_date": end_date,
-        "forecast_expected_total": forecast_expected_total,
-        "intelligence": intelligence_result,
-        "meta": meta,
-    }
+    return _forecast_for_restock(end_date, bundle.series, meta, horizon_days)
 
 
 def _action_item_from_dict(raw: dict) -> RestockActionItem:
@@ -140,7 +158,7 @@ def _action_item_from_dict(raw: dict) -> RestockActionItem:
 
 
 @router.get("/actions/total", response_model=RestockActionsResponse)
-def restock_actions_total(
+async def restock_actions_total(
     marketplace: str = Query(default="ALL"),
     horizon_days: int = Query(default=30, ge=7, le=60),
     lead_time_days: int = Query(default=14, ge=1, le=90),
@@ -148,16 +166,19 @@ def restock_actions_total(
     current_stock_units: float | None = Query(default=None, ge=0),
     include_unmapped: bool = Query(default=False, description="Include unmapped demand"),
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> RestockActionsResponse:
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """
     Return restock actions for total (aggregate) forecast.
 
     Phase 12.3: mapped demand by default; include_unmapped opt-in; data_quality in response.
+    Queries run on the async session; forecasting runs in the threadpool off the event loop.
     """
-    _validate_marketplace(db, marketplace)
-    data = _forecast_total_for_restock(
-        db, marketplace, horizon_days, include_unmapped=include_unmapped
+    end_date, actual_list, meta = await _run_with_marketplace_check(
+        db, marketplace, _total_demand_for_restock, marketplace, include_unmapped=include_unmapped
+    )
+    data = await run_in_threadpool(
+        _forecast_for_restock, end_date, actual_list, meta, horizon_days
     )
     end_date = data["end_date"]
     intelligence = data["intelligence"]
@@ -193,36 +214,27 @@ def restock_actions_total(
         severity=meta.severity,
     )
     item = _action_item_from_dict(raw)
-    return RestockActionsResponse(
-        generated_at=datetime.utcnow(),
-        items=[item],
-        data_quality=data_quality,
+    return model_json_response(
+        RestockActionsResponse(
+            generated_at=datetime.now(timezone.utc),
+            items=[item],
+            data_quality=data_quality,
+        )
     )
 
 
-@router.get("/actions/sku/{sku}", response_model=RestockActionsResponse)
-def restock_actions_sku(
+def _sku_action_raw(
+    *,
     sku: str,
-    marketplace: str = Query(default="ALL"),
-    horizon_days: int = Query(default=30, ge=7, le=60),
-    lead_time_days: int = Query(default=14, ge=1, le=90),
-    service_level: float = Query(default=0.95, ge=0.0, le=1.0),
-    current_stock_units: float | None = Query(default=None, ge=0),
-    include_unmapped: bool = Query(default=False, description="Include unmapped demand"),
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> RestockActionsResponse:
-    """
-    Return restock actions for a single SKU.
-
-    Phase 12.3: mapped demand by default; include_unmapped opt-in; data_quality in response.
-    """
-    _validate_marketplace(db, marketplace)
-    data = _forecast_sku_for_restock(
-        db, sku, marketplace, horizon_days, include_unmapped=include_unmapped
-    )
-    if data is None:
-        raise HTTPException(status_code=404, detail="SKU not found")
+    marketplace: str,
+    horizon_days: int,
+    lead_time_days: int,
+    service_level: float,
+    current_stock_units: float | None,
+    data: dict,
+    inventory: SkuInventoryRow | None,
+) -> dict:
+    """compute_restock_action for one SKU, resolving stock from inventory (Phase 11.4/11.5) when not given."""
     end_date = data["end_date"]
     intelligence = data["intelligence"]
     forecast_expected = data["forecast_expected_total"]
@@ -236,9 +248,9 @@ def restock_actions_sku(
     inv_as_of_at: datetime | None = None
     inv_warning_message: str | None = None
     if effective_stock is None and marketplace != "ALL":
-        inv = get_inventory(db, sku=sku, marketplace=marketplace)
+        inv = inventory
         if inv is not None:
-            effective_stock = inv.available_units()
+            effective_stock = inv.available_units
             inventory_used = True
             ts = inv.as_of_at if inv.as_of_at is not None else inv.updated_at
             inv_freshness, inv_age_hours = freshness_from_timestamp(ts)
@@ -275,6 +287,50 @@ def restock_actions_sku(
         raw["inventory_age_hours"] = inv_age_hours
         raw["inventory_as_of_at"] = inv_as_of_at
         raw["inventory_warning_message"] = inv_warning_message
+    return raw
+
+
+@router.get("/actions/sku/{sku}", response_model=RestockActionsResponse)
+async def restock_actions_sku(
+    sku: str,
+    marketplace: str = Query(default="ALL"),
+    horizon_days: int = Query(default=30, ge=7, le=60),
+    lead_time_days: int = Query(default=14, ge=1, le=90),
+    service_level: float = Query(default=0.95, ge=0.0, le=1.0),
+    current_stock_units: float | None = Query(default=None, ge=0),
+    include_unmapped: bool = Query(default=False, description="Include unmapped demand"),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Return restock actions for a single SKU.
+
+    Phase 12.3: mapped demand by default; include_unmapped opt-in; data_quality in response.
+    Marketplace check, series, and inventory come from one query (fetch_sku_bundle).
+    """
+    bundle = await db.run_sync(
+        fetch_sku_bundle, sku, marketplace, HISTORY_DAYS, include_unmapped=include_unmapped
+    )
+    if not bundle.marketplace_found:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Marketplace code not found: {marketplace!r}",
+        )
+    data = await run_in_threadpool(
+        _forecast_sku_for_restock, bundle, sku, horizon_days, include_unmapped=include_unmapped
+    )
+    if data is None:
+        raise HTTPException(status_code=404, detail="SKU not found")
+    raw = _sku_action_raw(
+        sku=sku,
+        marketplace=marketplace,
+        horizon_days=horizon_days,
+        lead_time_days=lead_time_days,
+        service_level=service_level,
+        current_stock_units=current_stock_units,
+        data=data,
+        inventory=bundle.inventory,
+    )
     meta = data["meta"]
     data_quality = DataQuality(
         mode=meta.mode,
@@ -288,8 +344,74 @@ def restock_actions_sku(
         severity=meta.severity,
     )
     item = _action_item_from_dict(raw)
-    return RestockActionsResponse(
-        generated_at=datetime.utcnow(),
-        items=[item],
-        data_quality=data_quality,
+    return model_json_response(
+        RestockActionsResponse(
+            generated_at=datetime.now(timezone.utc),
+            items=[item],
+            data_quality=data_quality,
+        )
+    )
+
+
+def _bulk_action_items(
+    body: RestockActionsBulkRequest,
+    skus: list[str],
+    bundles: dict[str, SkuBundle],
+) -> tuple[list[RestockActionItem], list[str]]:
+    """Forecast and compute actions for each prefetched SKU bundle; returns (items, skus_not_found)."""
+    items: list[RestockActionItem] = []
+    not_found: list[str] = []
+    for sku in skus:
+        bundle = bundles[sku]
+        data = _forecast_sku_for_restock(
+            bundle, sku, body.horizon_days, include_unmapped=body.include_unmapped
+        )
+        if data is None:
+            not_found.append(sku)
+            continue
+        raw = _sku_action_raw(
+            sku=sku,
+            marketplace=body.marketplace,
+            horizon_days=body.horizon_days,
+            lead_time_days=body.lead_time_days,
+            service_level=body.service_level,
+            current_stock_units=None,
+            data=data,
+            inventory=bundle.inventory,
+        )
+        items.append(_action_item_from_dict(raw))
+    return items, not_found
+
+
+@router.post("/actions/skus", response_model=RestockActionsBulkResponse)
+async def restock_actions_skus(
+    body: RestockActionsBulkRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Return restock actions for many SKUs in one request.
+
+    Series for all SKUs come from one query and inventory from another (fetch_sku_bundles);
+    forecasting then runs in-process per SKU. Items follow request order; SKUs with no
+    order history are listed in skus_not_found instead of failing the request.
+    """
+    skus = list(dict.fromkeys(body.skus))
+    bundles = await _run_with_marketplace_check(
+        db,
+        body.marketplace,
+        fetch_sku_bundles,
+        skus,
+        body.marketplace,
+        HISTORY_DAYS,
+        include_unmapped=body.include_unmapped,
+    )
+    items, not_found = await run_in_threadpool(_bulk_action_items, body, skus, bundles)
+    return model_json_response(
+        RestockActionsBulkResponse(
+            generated_at=datetime.now(timezone.utc),
+            items=items,
+            data_quality=None,
+            skus_not_found=not_found,
+        )
     )
@@ -1,91 +1,103 @@
 from __future__ import annotations
 
-import os
-from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import Literal
 
 from dotenv import load_dotenv
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load .env from repo root (amazon-dashboard/.env)
+# Load .env from repo root (amazon-dashboard/.env); workers also read some flags via os.getenv
 REPO_ROOT = Path(__file__).resolve().parents[3]
 ENV_PATH = REPO_ROOT / ".env"
 load_dotenv(ENV_PATH)
 
 
-def _require(name: str) -> str:
-    val = os.getenv(name)
-    if not val:
-        raise RuntimeError(f"Missing required environment variable: {name}")
-    return val
+class Settings(BaseSettings):
+    """Typed settings parsed once from the environment (field name = upper-case env var)."""
 
+    # Empty values (e.g. SMTP_HOST= in .env) count as unset, so optional fields stay None.
+    model_config = SettingsConfigDict(frozen=True, env_ignore_empty=True, extra="ignore")
 
-def _app_env() -> str:
-    val = os.getenv("APP_ENV", "development").strip().lower()
-    if val not in ("development", "production"):
-        raise RuntimeError(
-            f"Invalid APP_ENV: {val}. Must be 'development' or 'production'."
-        )
-    return val
+    app_env: Literal["development", "production"] = "development"
 
+    database_url: str
+    # Async engine pool (app.db.session.async_engine); defaults match the sync engine's 5 + 10
+    db_async_pool_size: int = 5
+    db_async_max_overflow: int = 10
 
-@dataclass(frozen=True)
-class Settings:
-    app_env: str = _app_env()
+    jwt_secret: str
+    jwt_algorithm: str = "HS256"
+    jwt_expires_minutes: int = 60
 
-    database_url: str = _require("DATABASE_URL")
+    # Optional: secret pepper for the HMAC-SHA256 password pre-hash. Changing it invalidates all passwords.
+    password_pepper: str | None = None
 
-    jwt_secret: str = _require("JWT_SECRET")
-    jwt_algorithm: str = os.getenv("JWT_ALGORITHM", "HS256")
-    jwt_expires_minutes: int = int(os.getenv("JWT_EXPIRES_MINUTES", "60"))
-
-    frontend_origin: str = os.getenv("FRONTEND_ORIGIN", "http://localhost:5173")
+    frontend_origin: str = "http://localhost:5173"
 
     # Rate limiting: requests per minute per IP (and per user when JWT present)
-    rate_limit_per_minute: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "100"))
+    rate_limit_per_minute: int = 100
+    # Optional: Redis URL for rate-limit counters shared across workers (e.g. redis://redis:6379/0)
+    redis_url: str | None = None
 
     # Optional: SMTP for alert emails (Phase 7B)
-    smtp_host: str | None = os.getenv("SMTP_HOST") or None
-    smtp_port: int = int(os.getenv("SMTP_PORT", "587"))
-    smtp_user: str | None = os.getenv("SMTP_USER") or None
-    smtp_pass: str | None = os.getenv("SMTP_PASS") or None
-    smtp_from: str | None = os.getenv("SMTP_FROM") or None
-    smtp_tls: bool = (os.getenv("SMTP_TLS", "true").strip().lower() in ("true", "1", "yes"))
+    smtp_host: str | None = None
+    smtp_port: int = 587
+    smtp_user: str | None = None
+    smtp_pass: str | None = None
+    smtp_from: str | None = None
+    smtp_tls: bool = True
 
     # Alerts worker: interval in seconds (default 15 minutes)
-    alerts_interval_seconds: int = int(os.getenv("ALERTS_INTERVAL_SECONDS", "900"))
+    alerts_interval_seconds: int = 900
 
     # Optional: base64 urlsafe Fernet key for encrypting LWA refresh token at rest (TOKEN_ENCRYPTION_KEY)
-    token_encryption_key: str | None = os.getenv("TOKEN_ENCRYPTION_KEY") or None
+    token_encryption_key: str | None = None
 
     # Inventory freshness (Phase 11.4): age in hours for stale warnings
-    inventory_stale_warning_hours: int = int(os.getenv("INVENTORY_STALE_WARNING_HOURS", "24"))
-    inventory_stale_critical_hours: int = int(os.getenv("INVENTORY_STALE_CRITICAL_HOURS", "72"))
+    inventory_stale_warning_hours: int = 24
+    inventory_stale_critical_hours: int = 72
 
     # Amazon Ads API (Sprint 13): optional; when set, sync can call Ads API
-    amazon_ads_client_id: str | None = os.getenv("AMAZON_ADS_CLIENT_ID") or None
-    amazon_ads_client_secret: str | None = os.getenv("AMAZON_ADS_CLIENT_SECRET") or None
-    amazon_ads_region: str = os.getenv("AMAZON_ADS_REGION", "NA").strip().upper()
+    amazon_ads_client_id: str | None = None
+    amazon_ads_client_secret: str | None = None
+    amazon_ads_region: str = "NA"
     # Rate limit: requests per second (Amazon recommends throttling)
-    amazon_ads_rate_limit_rps: float = float(os.getenv("AMAZON_ADS_RATE_LIMIT_RPS", "2.0"))
+    amazon_ads_rate_limit_rps: float = 2.0
     # Sprint 14: attribution lookback days for purchased product / advertised product reports
-    amazon_ads_attribution_lookback_days: int = int(os.getenv("AMAZON_ADS_ATTRIBUTION_LOOKBACK_DAYS", "30"))
+    amazon_ads_attribution_lookback_days: int = 30
 
     # Sprint 18: default Amazon account label (multi-account groundwork)
-    default_amazon_account_name: str = os.getenv("DEFAULT_AMAZON_ACCOUNT_NAME", "Default")
+    default_amazon_account_name: str = "Default"
 
     # Sprint 17: ops health and notifications
-    orders_stale_hours: int = int(os.getenv("ORDERS_STALE_HOURS", "12"))
-    ads_stale_hours: int = int(os.getenv("ADS_STALE_HOURS", "24"))
-    notifications_retry_max: int = int(os.getenv("NOTIFICATIONS_RETRY_MAX", "3"))
-    enable_notifications: bool = (os.getenv("ENABLE_NOTIFICATIONS", "true").strip().lower() in ("true", "1", "yes"))
-    enable_ops_health_checks: bool = (
-        os.getenv("ENABLE_OPS_HEALTH_CHECKS", "true").strip().lower() in ("true", "1", "yes")
-    )
+    orders_stale_hours: int = 12
+    ads_stale_hours: int = 24
+    notifications_retry_max: int = 3
+    enable_notifications: bool = True
+    enable_ops_health_checks: bool = True
 
     # Sprint 19: performance and observability
-    slow_query_ms: int = int(os.getenv("SLOW_QUERY_MS", "2000"))
-    dashboard_default_days: int = int(os.getenv("DASHBOARD_DEFAULT_DAYS", "90"))
-    cache_ttl_seconds: int = int(os.getenv("CACHE_TTL_SECONDS", "60"))
+    slow_query_ms: int = 2000
+    dashboard_default_days: int = 90
+    cache_ttl_seconds: int = 60
+
+    @field_validator("app_env", mode="before")
+    @classmethod
+    def _normalize_app_env(cls, v: object) -> object:
+        return v.strip().lower() if isinstance(v, str) else v
+
+    @field_validator("amazon_ads_region", mode="before")
+    @classmethod
+    def _normalize_ads_region(cls, v: object) -> object:
+        return v.strip().upper() if isinstance(v, str) else v
+
+
+@cache
+def get_settings() -> Settings:
+    """Process-wide Settings singleton; env is read once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
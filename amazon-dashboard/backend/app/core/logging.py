@@ -4,27 +4,45 @@ Fields: timestamp, level, service, environment, request_id, method, path, status
 """
 from __future__ import annotations
 
-import json
 import logging
+import re
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from app.core.config import settings
 
 
 SERVICE_NAME = "amazon-dashboard-api"
 
+# Keys containing any of these (case-insensitive) are redacted; one regex search per key.
+_REDACT_RE = re.compile("password|secret|token|authorization|api_key")
+# LogRecord attributes (and fields emitted explicitly above the extras) never copied as extras.
+_STD_RECORD_KEYS: frozenset[str] = frozenset({
+    "name", "msg", "args", "created", "filename", "funcName", "levelname",
+    "levelno", "lineno", "module", "msecs", "pathname", "process", "processName",
+    "relativeCreated", "stack_info", "exc_info", "exc_text", "thread", "threadName",
+    "taskName", "message", "asctime", "request_id", "method", "path", "status_code", "duration_ms",
+})
+# Non-string dict keys (e.g. ints in extras) are stringified like json.dumps did.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+@lru_cache(maxsize=1024)
+def _is_secret_key(key: str) -> bool:
+    return _REDACT_RE.search(key.lower()) is not None
+
 
 def _sanitize(obj: Any) -> Any:
     """Never log secrets; redact known secret keys."""
     if not isinstance(obj, dict):
         return obj
-    redact = {"password", "secret", "token", "authorization", "api_key", "jwt_secret"}
     out: dict[str, Any] = {}
     for k, v in obj.items():
-        key_lower = k.lower() if isinstance(k, str) else ""
-        if any(r in key_lower for r in redact):
+        if isinstance(k, str) and _is_secret_key(k):
             out[k] = "[REDACTED]"
         else:
             out[k] = _sanitize(v) if isinstance(v, (dict, list)) else v
@@ -41,7 +59,7 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_dict: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "service": self.service,
             "environment": self.environment,
@@ -61,14 +79,9 @@ class JsonFormatter(logging.Formatter):
             log_dict["exception"] = self.formatException(record.exc_info)
         # Extra fields (e.g. from log adapter) - sanitize
         for k, v in record.__dict__.items():
-            if k not in (
-                "name", "msg", "args", "created", "filename", "funcName", "levelname",
-                "levelno", "lineno", "module", "msecs", "pathname", "process", "processName",
-                "relativeCreated", "stack_info", "exc_info", "exc_text", "thread", "threadName",
-                "message", "asctime", "request_id", "method", "path", "status_code", "duration_ms",
-            ):
+            if k not in _STD_RECORD_KEYS:
                 log_dict[k] = _sanitize(v) if isinstance(v, (dict, list)) else v
-        return json.dumps(log_dict, default=str)
+        return orjson.dumps(log_dict, default=str, option=_ORJSON_OPTIONS).decode()
 
 
 def setup_logging() -> None:
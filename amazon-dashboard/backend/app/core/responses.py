@@ -0,0 +1,24 @@
+"""JSON responses: orjson default response class and a pydantic-core model response helper."""
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (same options as app.core.logging, plus numpy arrays/scalars)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes in pydantic-core.
+    For large list responses: skips FastAPI's response_model re-validation and encoder pass.
+    Keep response_model= on the route for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -1,21 +1,90 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import bcrypt
-from jose import jwt
+import jwt
+
+from app.core.config import settings
+
+# Hashes written with the HMAC pre-hash carry this prefix; bare bcrypt hashes are legacy
+# (first 72 bytes of the password) and are upgraded on the next successful login.
+PREHASH_PREFIX = "hmac-sha256$"
+
+# Successful bcrypt checks are remembered briefly so repeated logins skip the full cost.
+# Keys are HMACs under a per-process random key, so no password material is cached.
+# Private to this module (not app.core.cache) and locked: login handlers run on the threadpool.
+VERIFY_CACHE_TTL_SECONDS = 60
+VERIFY_CACHE_MAX_ENTRIES = 4096
+_verify_cache_key = secrets.token_bytes(32)
+# digest -> expiry (time.monotonic()), oldest first
+_verify_cache: OrderedDict[bytes, float] = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+
+def _verify_cache_hit(digest: bytes) -> bool:
+    """True if digest was cached by a successful check that has not expired."""
+    with _verify_cache_lock:
+        expiry = _verify_cache.get(digest)
+        if expiry is None:
+            return False
+        if time.monotonic() >= expiry:
+            del _verify_cache[digest]
+            return False
+        return True
+
+
+def _verify_cache_add(digest: bytes) -> None:
+    """Remember a successful check for VERIFY_CACHE_TTL_SECONDS, evicting the oldest when full."""
+    with _verify_cache_lock:
+        _verify_cache.pop(digest, None)
+        while len(_verify_cache) >= VERIFY_CACHE_MAX_ENTRIES:
+            _verify_cache.popitem(last=False)
+        _verify_cache[digest] = time.monotonic() + VERIFY_CACHE_TTL_SECONDS
+
+
+def _prehash(password: str) -> bytes:
+    """Fixed 44-byte bcrypt input: base64(HMAC-SHA256(pepper, password)). Never hits the 72-byte limit."""
+    pepper = (settings.password_pepper or "").encode("utf-8")
+    digest = hmac.new(pepper, password.encode("utf-8"), hashlib.sha256).digest()
+    return base64.b64encode(digest)
 
 
 def hash_password(password: str) -> str:
-    # bcrypt has a 72-byte limit; truncate to avoid ValueError with long passwords
-    raw = password.encode("utf-8")[:72]
-    return bcrypt.hashpw(raw, bcrypt.gensalt()).decode("utf-8")
+    return PREHASH_PREFIX + bcrypt.hashpw(_prehash(password), bcrypt.gensalt()).decode("utf-8")
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """True for legacy hashes that bcrypt the truncated raw password."""
+    return not password_hash.startswith(PREHASH_PREFIX)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
-    raw = password.encode("utf-8")[:72]
-    return bcrypt.checkpw(raw, password_hash.encode("utf-8"))
+    # Key includes the stored hash, so a password change (new salt) never hits an old entry.
+    digest = hmac.new(
+        _verify_cache_key,
+        password.encode("utf-8") + b"\0" + password_hash.encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+    if _verify_cache_hit(digest):
+        return True
+    if password_hash.startswith(PREHASH_PREFIX):
+        ok = bcrypt.checkpw(_prehash(password), password_hash[len(PREHASH_PREFIX):].encode("utf-8"))
+    else:
+        # Legacy hash: bcrypt has a 72-byte limit, so these were made from the truncated password
+        ok = bcrypt.checkpw(password.encode("utf-8")[:72], password_hash.encode("utf-8"))
+    # Only successes are cached: failed guesses must keep paying the bcrypt cost.
+    if ok:
+        _verify_cache_add(digest)
+    return ok
 
 
 def create_access_token(
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+# Compiled-statement LRU sized above the default 500 so lambda_stmt/select shapes of all routes stay cached.
+QUERY_CACHE_SIZE = 1200
+
+engine = create_engine(settings.database_url, pool_pre_ping=True, query_cache_size=QUERY_CACHE_SIZE)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for async routes; postgresql+psycopg URLs use psycopg 3's native async driver.
+# Its pool is separate from the sync engine's, so both count toward Postgres max_connections.
+async_engine = create_async_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    pool_size=settings.db_async_pool_size,
+    max_overflow=settings.db_async_max_overflow,
+    query_cache_size=QUERY_CACHE_SIZE,
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db():
     db = SessionLocal()
@@ -16,3 +32,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
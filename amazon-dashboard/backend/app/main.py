@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import FastAPI, Request
+from fastapi.datastructures import Default
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -9,6 +10,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.config import settings
 from app.core.version import VERSION
 from app.core.logging import setup_logging
+from app.core.responses import ORJSONResponse
 from app.api.routes.health import router as health_router
 from app.api.routes.auth import router as auth_router
 from app.api.routes.me import router as me_router
@@ -39,7 +41,13 @@ from app.middleware.rate_limit import RateLimitMiddleware
 setup_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Amazon Dashboard API", version=VERSION)
+# Default(...) keeps it a default: routes with a response_model still use FastAPI's own
+# pydantic-to-bytes path; orjson renders the plain dict/list responses.
+app = FastAPI(
+    title="Amazon Dashboard API",
+    version=VERSION,
+    default_response_class=Default(ORJSONResponse),
+)
 
 
 def _request_id(request: Request) -> str | None:
@@ -99,11 +107,21 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
     )
 
 
+# Development CORS: localhost / 127.0.0.1 on the usual dev-server ports (Vite 5173, 3000, 8080, ...),
+# expanded once into a frozenset so each preflight is a hash lookup instead of a regex match.
+DEV_CORS_PORTS = range(3000, 10000)
+DEV_CORS_ORIGINS = frozenset(
+    f"{scheme}://{host}:{port}"
+    for scheme in ("http", "https")
+    for host in ("localhost", "127.0.0.1")
+    for port in DEV_CORS_PORTS
+) | {settings.frontend_origin}
+
 # Middleware order: last added runs first. So: RequestContext -> RequestLogging -> RateLimit -> CORS -> app
 if settings.app_env == "development":
     app.add_middleware(
         CORSMiddleware,
-        allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1):\d+$",
+        allow_origins=DEV_CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -1,9 +1,15 @@
 """
-In-memory rate limiting: per IP and per user (when JWT present).
+Rate limiting: per IP and per user (when JWT present).
 Default 100 requests/minute. Returns 429 with JSON error.
+
+In-memory per process by default. When REDIS_URL is set, counters live in Redis
+(fixed one-minute windows, shared by all workers); on Redis errors we fall back to memory
+and skip Redis for _REDIS_BACKOFF_SEC before trying it again.
 """
 from __future__ import annotations
 
+import hashlib
+import logging
 import time
 from collections import defaultdict
 from collections.abc import Callable
@@ -14,6 +20,8 @@ from starlette.responses import JSONResponse, Response
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Key -> list of timestamps (request times in current window)
 _store: dict[str, list[float]] = defaultdict(list)
 _WINDOW_SEC = 60
@@ -21,6 +29,61 @@ _CLEANUP_INTERVAL = 300  # prune old keys every 5 min
 _last_cleanup = time.monotonic()
 
 
+# INCR each key (IP, then user) and start its TTL on first hit; one round-trip per request.
+_REDIS_INCR_LUA = """
+local counts = {}
+for i, key in ipairs(KEYS) do
+    local n = redis.call('INCR', key)
+    if n == 1 then
+        redis.call('EXPIRE', key, ARGV[1])
+    end
+    counts[i] = n
+end
+return counts
+"""
+_redis_incr = None  # registered Lua script, created on first use when REDIS_URL is set
+# Fail fast when Redis is unreachable instead of hanging requests until the TCP timeout.
+_REDIS_CONNECT_TIMEOUT_SEC = 0.25
+_REDIS_TIMEOUT_SEC = 0.25
+# After a Redis error, use in-memory counters for this long (and log once) before retrying.
+_REDIS_BACKOFF_SEC = 30
+_redis_retry_at = 0.0  # time.monotonic() before which Redis is skipped
+
+
+def _get_redis_incr():
+    global _redis_incr
+    if _redis_incr is None:
+        # Imported lazily: only needed when REDIS_URL is configured
+        from redis.asyncio import Redis
+
+        client = Redis.from_url(
+            settings.redis_url,
+            max_connections=100,
+            socket_connect_timeout=_REDIS_CONNECT_TIMEOUT_SEC,
+            socket_timeout=_REDIS_TIMEOUT_SEC,
+        )
+        _redis_incr = client.register_script(_REDIS_INCR_LUA)
+    return _redis_incr
+
+
+async def _check_limits(keys: list[str], limit: int) -> bool:
+    """True if every key is under limit, False if any is over (should 429)."""
+    global _redis_retry_at
+    if settings.redis_url and time.monotonic() >= _redis_retry_at:
+        window = int(time.time()) // _WINDOW_SEC
+        try:
+            counts = await _get_redis_incr()(
+                keys=[f"rl:{k}:{window}" for k in keys], args=[_WINDOW_SEC]
+            )
+            return all(int(n) <= limit for n in counts)
+        except Exception as e:
+            _redis_retry_at = time.monotonic() + _REDIS_BACKOFF_SEC
+            logger.warning(
+                "Redis rate limit unavailable, using in-memory for %ss: %s", _REDIS_BACKOFF_SEC, e
+            )
+    return all(_check_limit(k, limit) for k in keys)
+
+
 def _client_key(request: Request) -> str:
     # Prefer X-Forwarded-For when behind Caddy
     forwarded = request.headers.get("X-Forwarded-For")
@@ -35,11 +98,12 @@ def _user_key(request: Request) -> str | None:
     auth = request.headers.get("Authorization")
     if not auth or not auth.startswith("Bearer "):
         return None
-    # Use token as opaque key (avoid decoding JWT in middleware)
+    # Hash the whole token as an opaque key (avoid decoding JWT in middleware). A prefix would
+    # not do: every HS256 token starts with the same header, so all users would share one bucket.
     token = auth[7:].strip()
     if not token:
         return None
-    return f"user:{token[:32]}"
+    return f"user:{hashlib.blake2b(token.encode(), digest_size=16).hexdigest()}"
 
 
 def _check_limit(key: str, limit: int) -> bool:
@@ -74,19 +138,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         limit = settings.rate_limit_per_minute
-        # Check IP
-        if not _check_limit(_client_key(request), limit):
-            request_id = getattr(request.state, "request_id", None)
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": {"message": "Too many requests. Please try again later."},
-                    "request_id": request_id,
-                },
-            )
+        keys = [_client_key(request)]
         # If Bearer token present, also count per-user
         user_k = _user_key(request)
-        if user_k and not _check_limit(user_k, limit):
+        if user_k:
+            keys.append(user_k)
+        if not await _check_limits(keys, limit):
             request_id = getattr(request.state, "request_id", None)
             return JSONResponse(
                 status_code=429,
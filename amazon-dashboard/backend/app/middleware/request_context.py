@@ -1,10 +1,12 @@
 """
-Request context: X-Request-ID header (reuse from client or generate UUID).
+Request context: X-Request-ID header (reuse from client or generate a random ID).
+Generated IDs are a uuid4 as 22-char unpadded urlsafe base64.
 Sets request.state.request_id for use in logging and responses.
 """
 from __future__ import annotations
 
 import uuid
+from base64 import urlsafe_b64encode
 from collections.abc import Callable
 
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -13,13 +15,24 @@ from starlette.responses import Response
 
 
 REQUEST_ID_HEADER = "X-Request-ID"
+# Client-supplied IDs longer than this (or non-ASCII / blank) are replaced with a generated one.
+MAX_REQUEST_ID_LEN = 128
+
+
+def _new_request_id() -> str:
+    return urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode("ascii")
 
 
 class RequestContextMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         request_id = request.headers.get(REQUEST_ID_HEADER)
-        if not request_id or not request_id.strip():
-            request_id = str(uuid.uuid4())
+        if (
+            not request_id
+            or len(request_id) > MAX_REQUEST_ID_LEN
+            or not request_id.isascii()
+            or request_id.isspace()
+        ):
+            request_id = _new_request_id()
         request.state.request_id = request_id
         response = await call_next(request)
         response.headers[REQUEST_ID_HEADER] = request_id
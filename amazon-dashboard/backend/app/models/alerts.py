@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, func
+from sqlalchemy import BigInteger, Boolean, DateTime, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -22,7 +22,9 @@ class AlertEvent(Base):
     marketplace: Mapped[str | None] = mapped_column(String(20), nullable=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
-    dedupe_key: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    # Uniqueness is enforced on the 64-bit hash; the readable key is kept for debugging only.
+    dedupe_hash: Mapped[int] = mapped_column(BigInteger, nullable=False, unique=True)
+    dedupe_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_acknowledged: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     acknowledged_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
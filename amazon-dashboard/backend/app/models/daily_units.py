@@ -0,0 +1,17 @@
+"""Read-only daily_units_mv materialized view (migration 0023): units per sku, marketplace, day.
+
+Kept on its own MetaData so create_all never tries to create it as a table.
+"""
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, Date, Integer, MetaData, String, Table
+
+daily_units_mv = Table(
+    "daily_units_mv",
+    MetaData(),
+    Column("sku", String, nullable=False),
+    Column("marketplace_id", Integer, nullable=False),
+    Column("marketplace_code", String(10), nullable=False),
+    Column("order_date", Date, nullable=False),
+    Column("units", BigInteger, nullable=False),
+)
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, Numeric, String, UniqueConstraint, func
+from sqlalchemy import Computed, DateTime, Integer, Numeric, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -27,6 +27,12 @@ class InventoryLevel(Base):
     marketplace: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     on_hand_units: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False)
     reserved_units: Mapped[float | None] = mapped_column(Numeric(14, 2), nullable=True, default=0)
+    # Generated by Postgres (migration 0024): max(on_hand - reserved, 0); read-only.
+    available_units: Mapped[float] = mapped_column(
+        Numeric(14, 2),
+        Computed("GREATEST(on_hand_units - COALESCE(reserved_units, 0), 0)", persisted=True),
+        nullable=False,
+    )
     source: Mapped[str] = mapped_column(String(50), nullable=False, default="manual")
     source_key: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     as_of_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -37,8 +43,3 @@ class InventoryLevel(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
-
-    def available_units(self) -> float:
-        """Computed: max(on_hand - reserved, 0)."""
-        reserved = self.reserved_units or 0
-        return max(float(self.on_hand_units) - float(reserved), 0.0)
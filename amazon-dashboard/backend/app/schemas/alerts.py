@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Annotated
 
 from pydantic import BaseModel, Field
 
+from app.schemas.trusted import TrustedModel
 
-class AlertEventResponse(BaseModel):
+
+class AlertEventResponse(TrustedModel):
     """Single alert event for API response."""
 
     id: int = Field(..., description="Alert event ID")
@@ -30,12 +33,14 @@ class AlertListResponse(BaseModel):
 
 
 class AlertAcknowledgeRequest(BaseModel):
-    """Request body for acknowledging alerts."""
+    """Request body for acknowledging alerts. IDs must be JSON integers (strict: "42" is rejected)."""
 
-    ids: list[int] = Field(..., description="Alert event IDs to acknowledge", min_length=1)
+    ids: list[Annotated[int, Field(strict=True)]] = Field(
+        ..., description="Alert event IDs to acknowledge", min_length=1
+    )
 
 
-class AlertSettingsResponse(BaseModel):
+class AlertSettingsResponse(TrustedModel):
     """Alert settings (single row id=1)."""
 
     email_enabled: bool = Field(..., description="Whether email notifications are enabled")
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from decimal import Decimal
-
 from pydantic import BaseModel, ConfigDict
 
 
 class DashboardSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    revenue: Decimal
+    revenue: float
     units: int
     orders: int
-    ad_spend: Decimal
-    net_profit_placeholder: Decimal
+    ad_spend: float
+    net_profit_placeholder: float
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from datetime import date
+import datetime as dt
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic.dataclasses import dataclass
 
 
-class DashboardTimeseriesPoint(BaseModel):
-    date: date
+@dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class DashboardTimeseriesPoint:
+    # dt.date: a slot named `date` would shadow the type in the class body
+    date: dt.date
     revenue: float
     units: int
     orders: int
@@ -20,7 +23,8 @@ class DashboardTimeseriesResponse(BaseModel):
     points: list[DashboardTimeseriesPoint]
 
 
-class TopProductRow(BaseModel):
+@dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class TopProductRow:
     sku: str
     title: str | None
     asin: str | None
@@ -34,3 +38,8 @@ class TopProductsResponse(BaseModel):
     marketplace: str
     limit: int
     products: list[TopProductRow]
+
+
+# Built once at import: routes validate a whole list of row dicts in one pydantic-core call.
+TIMESERIES_POINTS_ADAPTER = TypeAdapter(list[DashboardTimeseriesPoint])
+TOP_PRODUCTS_ADAPTER = TypeAdapter(list[TopProductRow])
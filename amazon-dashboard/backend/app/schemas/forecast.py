@@ -3,18 +3,21 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic.dataclasses import dataclass
 
 from app.schemas.forecast_override import AppliedOverrideOut, ForecastBoundPoint, ForecastDrift
 
 
-class ForecastPoint(BaseModel):
+@dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class ForecastPoint:
     """Single point: date (ISO str) and units (int)."""
     date: str  # ISO date
     units: int
 
 
-class BacktestPoint(BaseModel):
+@dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class BacktestPoint:
     """Single backtest point: date, actual_units, predicted_units."""
     date: str
     actual_units: int
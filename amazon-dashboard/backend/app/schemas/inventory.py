@@ -2,16 +2,17 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
 
 
 class InventoryUpsertRequest(BaseModel):
-    """Body for PUT /api/inventory."""
+    """Body for PUT /api/inventory. Unit counts must be JSON numbers (strict: no numeric strings)."""
 
     sku: str = Field(..., min_length=1)
     marketplace: str = Field(..., min_length=1)
-    on_hand_units: float = Field(..., ge=0)
-    reserved_units: float = Field(default=0, ge=0)
+    on_hand_units: float = Field(..., ge=0, strict=True)
+    reserved_units: float = Field(default=0, ge=0, strict=True)
     source: str = Field(default="manual")
     note: str | None = None
 
@@ -48,7 +49,8 @@ class InventoryListResponse(BaseModel):
     items: list[InventoryItemResponse]
 
 
-class RestockRow(BaseModel):
+@dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class RestockRow:
     sku: str
     title: str | None
     asin: str | None
@@ -67,3 +69,7 @@ class RestockResponse(BaseModel):
     marketplace: str
     limit: int
     items: list[RestockRow]
+
+
+# Built once at import: the restock route validates its row dicts in one pydantic-core call.
+RESTOCK_ROWS_ADAPTER = TypeAdapter(list[RestockRow])
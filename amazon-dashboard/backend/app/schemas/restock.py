@@ -11,7 +11,7 @@ class RestockPlanRequest(BaseModel):
 
     sku: str = Field(..., min_length=1, description="Product SKU")
     marketplace: str = Field(..., min_length=1, description="Marketplace code (e.g. US)")
-    lead_time_days: int = Field(..., ge=1, le=365, description="Lead time in days (1-365)")
+    lead_time_days: int = Field(..., ge=1, le=365, strict=True, description="Lead time in days (1-365)")
     service_level: float = Field(
         default=0.95,
         ge=0.80,
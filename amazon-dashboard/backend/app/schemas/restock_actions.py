@@ -1,4 +1,4 @@
-"""Pydantic schemas for Restock Actions API (Phase 5C). Phase 11.4: inventory freshness. Phase 12.3: data_quality."""
+"""Pydantic schemas for Restock Actions API (Phase 5C). Phase 11.4: inventory freshness. Phase 12.3: data_quality. Bulk SKU request."""
 from __future__ import annotations
 
 from datetime import date, datetime
@@ -83,3 +83,22 @@ class RestockActionsResponse(BaseModel):
     data_quality: DataQuality | None = Field(
         None, description="Demand source mode, exclusions, and warnings"
     )
+
+
+class RestockActionsBulkRequest(BaseModel):
+    """Request body for POST /restock/actions/skus."""
+
+    skus: list[str] = Field(..., min_length=1, max_length=200, description="SKUs to evaluate (max 200)")
+    marketplace: str = Field(default="ALL", description="Marketplace code (e.g. US) or ALL")
+    horizon_days: int = Field(default=30, ge=7, le=60, description="Forecast horizon in days")
+    lead_time_days: int = Field(default=14, ge=1, le=90, description="Lead time in days")
+    service_level: float = Field(default=0.95, ge=0.0, le=1.0, description="Target service level (0–1)")
+    include_unmapped: bool = Field(default=False, description="Include unmapped demand")
+
+
+class RestockActionsBulkResponse(RestockActionsResponse):
+    """Response for POST /restock/actions/skus. data_quality is not aggregated across SKUs (null)."""
+
+    skus_not_found: list[str] = Field(
+        default_factory=list, description="Requested SKUs with no order history"
+    )
@@ -0,0 +1,15 @@
+"""Base for response schemas built straight from trusted DB rows."""
+from __future__ import annotations
+
+from typing import Any, Self
+
+from pydantic import BaseModel
+
+
+class TrustedModel(BaseModel):
+    """Response model that can skip validation when built from a DB row."""
+
+    @classmethod
+    def from_orm_trusted(cls, row: Any) -> Self:
+        """Build from a trusted DB row without validation (model_construct); never use for request input."""
+        return cls.model_construct(**{f: getattr(row, f) for f in cls.model_fields})
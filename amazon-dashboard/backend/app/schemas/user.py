@@ -1,12 +1,13 @@
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 
 from app.models.user import UserRole
 
 
 class UserPublic(BaseModel):
+    # Plain str: emails are validated by RegisterRequest on the way in, not again on every response.
     id: int
-    email: EmailStr
+    email: str
     role: UserRole
     created_at: datetime
@@ -6,9 +6,10 @@ from __future__ import annotations
 
 import argparse
 import random
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
-from decimal import Decimal
 
+import numpy as np
 from sqlalchemy import select
 
 from app.db.session import SessionLocal
@@ -17,13 +18,28 @@ from app.models.inventory_snapshot import InventorySnapshot
 from app.models.marketplace import Marketplace
 from app.models.order_item import OrderItem
 from app.models.product import Product
+from app.services.timeseries import refresh_daily_units
 
-BATCH_SIZE = 500
 STARTING_STOCK = 100
 RESTOCK_THRESHOLD = 20
 RESTOCK_TO = 100
 
 
+@contextmanager
+def _copy_into(db, model, columns: tuple[str, ...]):
+    """
+    Stream rows into model's table with COPY ... FROM STDIN on the session's connection.
+    Yields psycopg's Copy; call write_row(tuple) per row. Caller commits. The connection
+    is busy until the block exits, so rows must not touch unloaded ORM attributes.
+    """
+    cur = db.connection().connection.driver_connection.cursor()
+    try:
+        with cur.copy(f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN") as copy:
+            yield copy
+    finally:
+        cur.close()
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Seed mock Amazon dashboard data")
     p.add_argument("--days", type=int, default=120, help="Number of days of data to generate")
@@ -63,13 +79,15 @@ def ensure_products(db, target: int, rng: random.Random) -> tuple[list[Product],
     for p in existing:
         sku_to_price[p.sku] = float(rng.uniform(10, 80))  # deterministic per run for existing
     products = list(existing)
+    taken_skus = {p.sku for p in products}
     next_id = max((p.id for p in products), default=0) + 1
     next_sku = 1
     while len(products) < target:
         sku = f"SKU-{next_sku:04d}"
         next_sku += 1
-        if db.scalar(select(Product).where(Product.sku == sku)):
+        if sku in taken_skus:
             continue
+        taken_skus.add(sku)
         price = round(rng.uniform(10, 80), 2)
         sku_to_price[sku] = price
         prod = Product(
@@ -80,7 +98,6 @@ def ensure_products(db, target: int, rng: random.Random) -> tuple[list[Product],
             created_at=datetime.now(timezone.utc),
         )
         db.add(prod)
-        db.flush()
         products.append(prod)
         next_id += 1
     db.commit()
@@ -98,51 +115,72 @@ def generate_orders(
     sku_to_price: dict[str, float],
     start_date: date,
     end_date: date,
-    rng: random.Random,
+    np_rng: np.random.Generator,
 ) -> tuple[dict[tuple[date, int], float], dict[tuple[date, str], int]]:
-    """Generate order_items. Return daily_revenue[(date, marketplace_id)] and units_sold[(date, sku)]."""
-    daily_revenue: dict[tuple[date, int], float] = {}
-    units_sold: dict[tuple[date, str], int] = {}
+    """Generate order_items. Return daily_revenue[(date, marketplace_id)] and units_sold[(date, sku)].
+
+    Lines for one (date, marketplace) are drawn in a few NumPy calls; only writing COPY
+    rows loops per line.
+    """
+    skus = [p.sku for p in products]
+    n_products = len(products)
+    n_days = (end_date - start_date).days + 1
+    # Plain values only inside COPY: a lazy attribute load would need the busy connection.
+    mk_list = [(code, mk.id) for code, mk in marketplaces.items()]
+    # Accumulate into (day, marketplace) and (day, sku) grids; dicts are built once at the end.
+    revenue_grid = np.zeros((max(n_days, 0), len(mk_list)), dtype=np.float64)
+    units_grid = np.zeros((max(n_days, 0), n_products), dtype=np.int64)
+    prices = np.array([sku_to_price[sku] for sku in skus], dtype=np.float64)
     # Biased weights: earlier products (lower index) get higher weight
-    weights = [len(products) - i for i in range(len(products))]
-    batch: list[OrderItem] = []
+    weights = np.arange(n_products, 0, -1, dtype=np.float64)
+    # Cumulative weights hoisted out of the loop; searchsorted on uniform draws is what
+    # Generator.choice(p=...) does internally, minus rebuilding the CDF on every call.
+    cum_weights = np.cumsum(weights)
+    cum_weights /= cum_weights[-1]
     order_idx = 0
-    current = start_date
-    while current <= end_date:
-        weekday = current.weekday()  # 0 Mon .. 6 Sun; 5,6 = weekend
-        is_weekend = weekday >= 5
-        for code, mk in marketplaces.items():
-            n_orders = rng.randint(2, 8) if is_weekend else rng.randint(5, 25)
-            for _ in range(n_orders):
-                order_id = f"{current.isoformat()}_{code}_{order_idx}"
-                order_idx += 1
-                n_lines = rng.randint(1, 4)
-                chosen = rng.choices(products, weights=weights, k=n_lines)
-                for prod in chosen:
-                    units = rng.randint(1, 4)
-                    rev = round(units * sku_to_price[prod.sku], 2)
-                    batch.append(
-                        OrderItem(
-                            order_id=order_id,
-                            order_date=current,
-                            marketplace_id=mk.id,
-                            sku=prod.sku,
-                            units=units,
-                            revenue=Decimal(str(rev)),
+    with _copy_into(
+        db, OrderItem, ("order_id", "order_date", "marketplace_id", "sku", "units", "revenue")
+    ) as copy:
+        for day_idx in range(n_days):
+            current = start_date + timedelta(days=day_idx)
+            weekday = current.weekday()  # 0 Mon .. 6 Sun; 5,6 = weekend
+            is_weekend = weekday >= 5
+            for mk_idx, (code, mk_id) in enumerate(mk_list):
+                n_orders = int(np_rng.integers(2, 9) if is_weekend else np_rng.integers(5, 26))
+                lines_per_order = np_rng.integers(1, 5, size=n_orders)
+                n_lines = int(lines_per_order.sum())
+                sku_idx = cum_weights.searchsorted(np_rng.random(n_lines), side="right")
+                units = np_rng.integers(1, 5, size=n_lines)
+                revs = np.round(units * prices[sku_idx], 2)
+                order_nums = np.repeat(np.arange(order_idx, order_idx + n_orders), lines_per_order)
+                order_idx += n_orders
+
+                for order_num, i, u, rev in zip(
+                    order_nums.tolist(), sku_idx.tolist(), units.tolist(), revs.tolist()
+                ):
+                    copy.write_row(
+                        (
+                            f"{current.isoformat()}_{code}_{order_num}",
+                            current,
+                            mk_id,
+                            skus[i],
+                            u,
+                            rev,
                         )
                     )
-                    key_dr = (current, mk.id)
-                    daily_revenue[key_dr] = daily_revenue.get(key_dr, 0) + rev
-                    key_us = (current, prod.sku)
-                    units_sold[key_us] = units_sold.get(key_us, 0) + units
-                if len(batch) >= BATCH_SIZE:
-                    db.bulk_save_objects(batch)
-                    db.commit()
-                    batch = []
-        current += timedelta(days=1)
-    if batch:
-        db.bulk_save_objects(batch)
-        db.commit()
+                revenue_grid[day_idx, mk_idx] += revs.sum()
+                np.add.at(units_grid[day_idx], sku_idx, units)
+    db.commit()
+
+    dates = [start_date + timedelta(days=i) for i in range(n_days)]
+    daily_revenue = {
+        (dates[d], mk_list[m][1]): float(revenue_grid[d, m])
+        for d in range(n_days)
+        for m in range(len(mk_list))
+    }
+    units_sold = {
+        (dates[d], skus[i]): int(units_grid[d, i]) for d, i in zip(*np.nonzero(units_grid))
+    }
     return daily_revenue, units_sold
 
 
@@ -152,33 +190,37 @@ def generate_ad_spend(
     daily_revenue: dict[tuple[date, int], float],
     start_date: date,
     end_date: date,
-    rng: random.Random,
+    np_rng: np.random.Generator,
 ) -> None:
-    batch: list[AdSpendDaily] = []
-    current = start_date
-    while current <= end_date:
-        for mk in marketplaces.values():
-            rev = daily_revenue.get((current, mk.id), 0)
-            pct = rng.uniform(0.03, 0.15)
-            noise = rng.uniform(0.9, 1.1)
-            spend = round(rev * pct * noise, 2)
-            if spend < 0:
-                spend = 0
-            batch.append(
-                AdSpendDaily(
-                    date=current,
-                    marketplace_id=mk.id,
-                    spend=Decimal(str(spend)),
-                )
-            )
-        if len(batch) >= BATCH_SIZE:
-            db.bulk_save_objects(batch)
-            db.commit()
-            batch = []
-        current += timedelta(days=1)
-    if batch:
-        db.bulk_save_objects(batch)
-        db.commit()
+    """Ad spend is 3-15% of each (date, marketplace) revenue with +/-10% noise, drawn in one shot."""
+    mk_ids = [mk.id for mk in marketplaces.values()]
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    rev = np.array(
+        [[daily_revenue.get((d, mk_id), 0.0) for mk_id in mk_ids] for d in dates], dtype=np.float64
+    ).reshape(len(dates), len(mk_ids))
+    pct = np_rng.uniform(0.03, 0.15, rev.shape)
+    noise = np_rng.uniform(0.9, 1.1, rev.shape)
+    spend = np.round(np.maximum(rev * pct * noise, 0.0), 2).tolist()
+    with _copy_into(db, AdSpendDaily, ("date", "marketplace_id", "spend")) as copy:
+        for d, row in zip(dates, spend):
+            for mk_id, value in zip(mk_ids, row):
+                copy.write_row((d, mk_id, value))
+    db.commit()
+
+
+def simulate_stock(sold: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """
+    On-hand per (day, product) from a (days, products) sold matrix.
+    Each day: stock = max(0, stock - sold); at or below RESTOCK_THRESHOLD, restock to
+    RESTOCK_TO when that cell's draw (uniform [0, 1)) is < 0.3. Loops over days only.
+    """
+    on_hand = np.empty_like(sold)
+    stock = np.full(sold.shape[1], STARTING_STOCK, dtype=np.int64)
+    for d in range(sold.shape[0]):
+        np.maximum(stock - sold[d], 0, out=stock)
+        stock[(stock <= RESTOCK_THRESHOLD) & (draws[d] < 0.3)] = RESTOCK_TO
+        on_hand[d] = stock
+    return on_hand
 
 
 def generate_inventory(
@@ -187,37 +229,30 @@ def generate_inventory(
     units_sold: dict[tuple[date, str], int],
     start_date: date,
     end_date: date,
-    rng: random.Random,
+    np_rng: np.random.Generator,
 ) -> None:
-    stock: dict[str, int] = {p.sku: STARTING_STOCK for p in products}
-    batch: list[InventorySnapshot] = []
-    current = start_date
-    while current <= end_date:
-        for prod in products:
-            sold = units_sold.get((current, prod.sku), 0)
-            stock[prod.sku] = max(0, stock[prod.sku] - sold)
-            if stock[prod.sku] <= RESTOCK_THRESHOLD and rng.random() < 0.3:
-                stock[prod.sku] = RESTOCK_TO
-            batch.append(
-                InventorySnapshot(
-                    date=current,
-                    sku=prod.sku,
-                    on_hand=stock[prod.sku],
-                )
-            )
-        if len(batch) >= BATCH_SIZE:
-            db.bulk_save_objects(batch)
-            db.commit()
-            batch = []
-        current += timedelta(days=1)
-    if batch:
-        db.bulk_save_objects(batch)
-        db.commit()
+    n_days = max((end_date - start_date).days + 1, 0)
+    sku_pos = {p.sku: i for i, p in enumerate(products)}
+    sold = np.zeros((n_days, len(products)), dtype=np.int64)
+    for (d, sku), units in units_sold.items():
+        i = sku_pos.get(sku)
+        if i is not None and start_date <= d <= end_date:
+            sold[(d - start_date).days, i] += units
+    on_hand = simulate_stock(sold, np_rng.random(sold.shape))
+
+    skus = list(sku_pos)
+    with _copy_into(db, InventorySnapshot, ("date", "sku", "on_hand")) as copy:
+        for d, row in enumerate(on_hand.tolist()):
+            current = start_date + timedelta(days=d)
+            for sku, units in zip(skus, row):
+                copy.write_row((current, sku, units))
+    db.commit()
 
 
 def main() -> None:
     args = parse_args()
     rng = random.Random(args.seed)
+    np_rng = np.random.default_rng(args.seed)
     codes = [c.strip() for c in args.marketplaces.split(",") if c.strip()]
     if not codes:
         codes = ["US", "UK", "DE"]
@@ -230,10 +265,12 @@ def main() -> None:
         marketplaces = ensure_marketplaces(db, codes)
         products, sku_to_price = ensure_products(db, args.products, rng)
         daily_revenue, units_sold = generate_orders(
-            db, marketplaces, products, sku_to_price, start_date, end_date, rng
+            db, marketplaces, products, sku_to_price, start_date, end_date, np_rng
         )
-        generate_ad_spend(db, marketplaces, daily_revenue, start_date, end_date, rng)
-        generate_inventory(db, products, units_sold, start_date, end_date, rng)
+        generate_ad_spend(db, marketplaces, daily_revenue, start_date, end_date, np_rng)
+        generate_inventory(db, products, units_sold, start_date, end_date, np_rng)
+        refresh_daily_units(db)
+        db.commit()
         print(
             f"Seeded: {len(marketplaces)} marketplaces, {len(products)} products, "
             f"orders from {start_date} to {end_date}"
@@ -8,7 +8,6 @@ Resilient: missing mappings/COGS/attribution yield warnings, not crashes.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -20,42 +19,11 @@ from app.models.marketplace import Marketplace
 from app.models.order_item import OrderItem
 from app.models.sku_cost import SkuCost
 from app.models.sku_mapping import SkuMapping
+from app.schemas.ads_attribution import SkuProfitabilityRow, SkuTimeseriesPoint
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class SkuProfitabilityRow:
-    """Single SKU profitability row for get_sku_profitability."""
-
-    sku: str
-    marketplace_code: str
-    revenue: Decimal
-    ad_spend: Decimal | None
-    attributed_sales: Decimal | None
-    organic_sales: Decimal | None
-    units_sold: int
-    unit_cogs: Decimal | None
-    total_cogs: Decimal | None
-    gross_profit: Decimal | None
-    net_profit: Decimal | None
-    acos: Decimal | None
-    roas: Decimal | None
-    warning_flags: list[str]
-
-
-@dataclass
-class SkuTimeseriesPoint:
-    """Single day in SKU profitability timeseries."""
-
-    date: date
-    revenue: Decimal
-    ad_spend: Decimal
-    attributed_sales: Decimal | None
-    net_profit: Decimal | None
-    units: int
-
-
 def _resolve_marketplace_filter(
     db: Session, marketplace: str | None
 ) -> tuple[int | None, str]:
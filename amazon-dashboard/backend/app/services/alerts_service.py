@@ -6,25 +6,29 @@ Optionally sends email via stdlib smtplib.
 """
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import smtplib
-from datetime import date, datetime, timedelta, timezone
+import threading
+import time
+from collections.abc import Sequence
+from datetime import date, datetime, timezone
 from email.message import EmailMessage
-from typing import Any
+from hashlib import blake2b
+from typing import Any, NamedTuple
 
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Row, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.models.alerts import ALERT_SETTINGS_ID, AlertEvent, AlertSettings
-from app.models.inventory import InventoryLevel
 from app.models.user import User
 from app.services.forecast_intelligence import build_intelligence
 from app.services.forecasting import (
-    _series_from_points,
-    backtest_30d,
-    seasonal_naive_weekly,
+    snaive_backtest_and_forecast,
+    units_from_points,
 )
 from app.services.inventory_service import (
     freshness_from_timestamp,
@@ -32,10 +36,7 @@ from app.services.inventory_service import (
     list_inventory,
 )
 from app.services.restock_actions import compute_restock_action
-from app.services.timeseries import (
-    get_data_end_date_sku,
-    get_daily_units_by_sku,
-)
+from app.services.timeseries import get_daily_units_bulk
 
 logger = logging.getLogger(__name__)
 
@@ -46,24 +47,16 @@ SERVICE_LEVEL = 0.95
 
 
 def _forecast_sku_for_restock(
-    db: Session,
-    sku: str,
-    marketplace: str,
+    end_date: date,
+    actual_list: list[tuple[date, int]],
     horizon_days: int = HORIZON_DAYS,
-) -> dict[str, Any] | None:
-    """Same logic as restock_actions route: forecast + intelligence for one SKU."""
-    end_date = get_data_end_date_sku(db, sku, marketplace)
-    if end_date is None:
-        return None
-    start_date = end_date - timedelta(days=HISTORY_DAYS - 1)
-    actual_list = get_daily_units_by_sku(db, sku, start_date, end_date, marketplace)
-    mae_30d, mape_30d, _ = backtest_30d(actual_list, use_seasonal_naive=True)
-    series = _series_from_points(actual_list)
-    forecast_series = seasonal_naive_weekly(series, horizon_days)
-    forecast_expected_total = float(forecast_series.sum())
-    history_daily_units = [float(u) for _, u in actual_list]
+) -> dict[str, Any]:
+    """Same logic as restock_actions route: forecast + intelligence for one SKU's history."""
+    # One pass over actual_list; backtest, forecast and intelligence share the dense units array.
+    units_arr = units_from_points(actual_list)
+    mae_30d, mape_30d, forecast_expected_total = snaive_backtest_and_forecast(units_arr, horizon_days)
     intelligence_result = build_intelligence(
-        history_daily_units=history_daily_units,
+        history_daily_units=units_arr,
         forecast_expected_total=forecast_expected_total,
         horizon_days=horizon_days,
         mape_30d=mape_30d,
@@ -98,23 +91,28 @@ def get_or_create_settings(db: Session) -> AlertSettings:
     return row
 
 
+# Boolean AlertSettings columns a settings patch may set; None in the patch leaves them unchanged.
+_SETTINGS_BOOL_FIELDS = (
+    "email_enabled",
+    "send_inventory_stale",
+    "send_urgent_restock",
+    "send_reorder_soon",
+    "send_order_by_passed",
+)
+
+
 def update_settings(db: Session, patch: dict[str, Any]) -> AlertSettings:
     """Update alert settings (id=1) with given fields; validate stale_days_threshold 1..60."""
     row = get_or_create_settings(db)
-    if "email_enabled" in patch and patch["email_enabled"] is not None:
-        row.email_enabled = bool(patch["email_enabled"])
+    for field in _SETTINGS_BOOL_FIELDS:
+        value = patch.get(field)
+        if value is not None:
+            setattr(row, field, bool(value))
     if "email_recipients" in patch:
-        row.email_recipients = patch["email_recipients"] if patch["email_recipients"] else None
-    if "send_inventory_stale" in patch and patch["send_inventory_stale"] is not None:
-        row.send_inventory_stale = bool(patch["send_inventory_stale"])
-    if "send_urgent_restock" in patch and patch["send_urgent_restock"] is not None:
-        row.send_urgent_restock = bool(patch["send_urgent_restock"])
-    if "send_reorder_soon" in patch and patch["send_reorder_soon"] is not None:
-        row.send_reorder_soon = bool(patch["send_reorder_soon"])
-    if "send_order_by_passed" in patch and patch["send_order_by_passed"] is not None:
-        row.send_order_by_passed = bool(patch["send_order_by_passed"])
-    if "stale_days_threshold" in patch and patch["stale_days_threshold"] is not None:
-        v = int(patch["stale_days_threshold"])
+        row.email_recipients = patch["email_recipients"] or None
+    v = patch.get("stale_days_threshold")
+    if v is not None:
+        v = int(v)
         if not (1 <= v <= 60):
             raise ValueError("stale_days_threshold must be between 1 and 60")
         row.stale_days_threshold = v
@@ -128,15 +126,20 @@ def list_alerts(
     severity: str | None = None,
     unacknowledged_only: bool = False,
     limit: int = 200,
-) -> list[AlertEvent]:
-    """List alert events with optional filters."""
-    stmt = select(AlertEvent).order_by(AlertEvent.created_at.desc())
+) -> Sequence[Row]:
+    """
+    List alert events with optional filters, newest first. Returns plain column rows
+    (attribute access like AlertEvent) rather than ORM instances: the list endpoint only
+    reads them, so identity-map and instance-state setup per row is skipped.
+    """
+    table = AlertEvent.__table__
+    stmt = select(table).order_by(table.c.created_at.desc())
     if severity:
-        stmt = stmt.where(AlertEvent.severity == severity)
+        stmt = stmt.where(table.c.severity == severity)
     if unacknowledged_only:
-        stmt = stmt.where(AlertEvent.is_acknowledged == False)  # noqa: E712
+        stmt = stmt.where(table.c.is_acknowledged == False)  # noqa: E712
     stmt = stmt.limit(max(1, min(limit, 500)))
-    return list(db.scalars(stmt).all())
+    return db.execute(stmt).all()
 
 
 def acknowledge_alerts(db: Session, ids: list[int]) -> int:
@@ -144,51 +147,135 @@ def acknowledge_alerts(db: Session, ids: list[int]) -> int:
     if not ids:
         return 0
     now = datetime.now(timezone.utc)
-    stmt = select(AlertEvent).where(
-        AlertEvent.id.in_(ids),
-        AlertEvent.is_acknowledged == False,  # noqa: E712
+    # One UPDATE for all ids; no rows are loaded into the session
+    stmt = (
+        update(AlertEvent)
+        .where(
+            AlertEvent.id.in_(ids),
+            AlertEvent.is_acknowledged == False,  # noqa: E712
+        )
+        .values(is_acknowledged=True, acknowledged_at=now)
     )
-    rows = list(db.scalars(stmt).all())
-    for row in rows:
-        row.is_acknowledged = True
-        row.acknowledged_at = now
+    result = db.execute(stmt)
     db.commit()
-    return len(rows)
+    return result.rowcount
 
 
-def _send_alert_email(
-    to_emails: list[str],
-    subject: str,
-    body: str,
-) -> bool:
-    """Send one email via SMTP (stdlib). Returns True if sent."""
-    if not to_emails:
-        return False
-    host = getattr(settings, "smtp_host", None) or None
-    if not host:
-        logger.debug("SMTP not configured; skipping email")
-        return False
-    port = getattr(settings, "smtp_port", 587)
-    user = getattr(settings, "smtp_user", None)
-    password = getattr(settings, "smtp_pass", None)
-    from_addr = getattr(settings, "smtp_from", None) or user or to_emails[0]
-    use_tls = getattr(settings, "smtp_tls", True)
-    try:
-        msg = EmailMessage()
-        msg["Subject"] = subject
-        msg["From"] = from_addr
-        msg["To"] = ", ".join(to_emails)
-        msg.set_content(body)
-        with smtplib.SMTP(host, port) as smtp:
-            if use_tls:
-                smtp.starttls()
-            if user and password:
-                smtp.login(user, password)
-            smtp.send_message(msg)
-        return True
-    except Exception as e:
-        logger.warning("Failed to send alert email: %s", e)
-        return False
+class AlertMailer:
+    """
+    One SMTP session (connect, STARTTLS, login) shared by every email of an alert run.
+    Connects on the first send, so runs that email nothing never touch SMTP; a failed send
+    drops the session and the next send reconnects. Use as a context manager (QUIT on exit).
+    """
+
+    def __init__(self) -> None:
+        self._smtp: smtplib.SMTP | None = None
+
+    def __enter__(self) -> AlertMailer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            self._smtp.close()
+        self._smtp = None
+
+    def _session(self, host: str) -> smtplib.SMTP:
+        if self._smtp is None:
+            smtp = smtplib.SMTP(host, getattr(settings, "smtp_port", 587))
+            try:
+                if getattr(settings, "smtp_tls", True):
+                    smtp.starttls()
+                user = getattr(settings, "smtp_user", None)
+                password = getattr(settings, "smtp_pass", None)
+                if user and password:
+                    smtp.login(user, password)
+            except Exception:
+                smtp.close()
+                raise
+            self._smtp = smtp
+        return self._smtp
+
+    def send(self, to_emails: list[str], subject: str, body: str) -> bool:
+        """Send one email on the shared session. Returns True if sent."""
+        if not to_emails:
+            return False
+        host = getattr(settings, "smtp_host", None) or None
+        if not host:
+            logger.debug("SMTP not configured; skipping email")
+            return False
+        user = getattr(settings, "smtp_user", None)
+        from_addr = getattr(settings, "smtp_from", None) or user or to_emails[0]
+        try:
+            msg = EmailMessage()
+            msg["Subject"] = subject
+            msg["From"] = from_addr
+            msg["To"] = ", ".join(to_emails)
+            msg.set_content(body)
+            self._session(host).send_message(msg)
+            return True
+        except Exception as e:
+            logger.warning("Failed to send alert email: %s", e)
+            self.close()
+            return False
+
+
+# POST /alerts/run hands its emails to one background thread so the request doesn't wait on
+# SMTP (the alerts worker sends inline). Its session is closed after EMAIL_IDLE_SECONDS without
+# mail, so an idle connection is not held open between runs; at exit the queue is drained for up
+# to EMAIL_DRAIN_SECONDS so queued alerts are not dropped on shutdown or reload.
+EMAIL_IDLE_SECONDS = 30
+EMAIL_DRAIN_SECONDS = 30
+_email_queue: queue.Queue[tuple[list[str], str, str]] = queue.Queue()
+_email_thread: threading.Thread | None = None
+_email_thread_lock = threading.Lock()
+
+
+def _email_worker() -> None:
+    with AlertMailer() as mailer:
+        while True:
+            try:
+                to_emails, subject, body = _email_queue.get(timeout=EMAIL_IDLE_SECONDS)
+            except queue.Empty:
+                mailer.close()
+                continue
+            try:
+                mailer.send(to_emails, subject, body)
+            except Exception:
+                logger.exception("Alert email worker failed to send")
+            finally:
+                _email_queue.task_done()
+
+
+def _enqueue_alert_email(to_emails: list[str], subject: str, body: str) -> None:
+    """Queue one email for the background sender, starting it on first use."""
+    global _email_thread
+    with _email_thread_lock:
+        if _email_thread is None or not _email_thread.is_alive():
+            _email_thread = threading.Thread(target=_email_worker, name="alert-email", daemon=True)
+            _email_thread.start()
+    _email_queue.put((to_emails, subject, body))
+
+
+@atexit.register
+def _drain_email_queue() -> None:
+    """Wait (bounded) for the background sender to finish queued emails before the process exits."""
+    deadline = time.monotonic() + EMAIL_DRAIN_SECONDS
+    with _email_queue.all_tasks_done:
+        while _email_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(
+                    "Exiting with %s alert email(s) unsent", _email_queue.unfinished_tasks
+                )
+                return
+            _email_queue.all_tasks_done.wait(remaining)
 
 
 def _recipient_emails(db: Session, settings_row: AlertSettings) -> list[str]:
@@ -199,8 +286,21 @@ def _recipient_emails(db: Session, settings_row: AlertSettings) -> list[str]:
     return list(users)
 
 
-def _try_create_alert(
-    db: Session,
+class _AlertCandidate(NamedTuple):
+    """An alert_events row to insert, plus how to email it if it turns out to be new."""
+
+    values: dict[str, Any]
+    send_flag: str  # AlertSettings column gating email for this alert type
+    subject: str
+    view: str
+
+
+def _dedupe_hash(dedupe_key: str) -> int:
+    """Signed 64-bit blake2b of dedupe_key; alert_events.dedupe_hash is the unique dedupe column."""
+    return int.from_bytes(blake2b(dedupe_key.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+def _alert_candidate(
     alert_type: str,
     severity: str,
     sku: str | None,
@@ -208,42 +308,53 @@ def _try_create_alert(
     title: str,
     message: str,
     dedupe_key: str,
-) -> AlertEvent | None:
-    """Insert one alert; return the row if inserted, None if duplicate dedupe_key."""
-    row = AlertEvent(
-        alert_type=alert_type,
-        severity=severity,
-        sku=sku,
-        marketplace=marketplace,
-        title=title,
-        message=message,
-        dedupe_key=dedupe_key,
-        is_acknowledged=False,
-        acknowledged_at=None,
+    created_at: datetime,
+    *,
+    send_flag: str,
+    subject: str,
+    view: str,
+) -> _AlertCandidate:
+    """Build an alert_events insert row (unacknowledged, stamped created_at) with its email routing."""
+    values = {
+        "alert_type": alert_type,
+        "severity": severity,
+        "sku": sku,
+        "marketplace": marketplace,
+        "title": title,
+        "message": message,
+        "dedupe_key": dedupe_key,
+        "dedupe_hash": _dedupe_hash(dedupe_key),
+        "is_acknowledged": False,
+        "acknowledged_at": None,
+        "created_at": created_at,
+    }
+    return _AlertCandidate(values, send_flag, subject, view)
+
+
+def _bulk_create_alerts(db: Session, candidates: list[_AlertCandidate]) -> set[int]:
+    """
+    Insert all candidates in one statement; existing dedupe hashes are skipped by
+    ON CONFLICT DO NOTHING. Returns the dedupe_hash of each row actually inserted.
+    """
+    if not candidates:
+        return set()
+    stmt = (
+        pg_insert(AlertEvent)
+        .values([c.values for c in candidates])
+        .on_conflict_do_nothing(index_elements=[AlertEvent.dedupe_hash])
+        .returning(AlertEvent.dedupe_hash)
     )
-    try:
-        with db.begin_nested():
-            db.add(row)
-            db.flush()
-        return row
-    except IntegrityError:
-        return None
+    return set(db.scalars(stmt).all())
 
 
-def _stale_inventory_alert_for_inv(
-    db: Session,
-    inv: InventoryLevel,
-    settings_row: AlertSettings,
-    created_ref: list[int],
-    emailed_ref: list[int],
-) -> None:
-    """Phase 11.4: Create stale inventory alert(s) from hour-based freshness; dedupe by sku+marketplace+severity."""
+def _stale_inventory_alert_for_inv(inv: Row, now: datetime) -> _AlertCandidate | None:
+    """Phase 11.4: Stale inventory alert candidate from hour-based freshness; dedupe by sku+marketplace+severity."""
     sku = inv.sku
     marketplace = inv.marketplace
     ts = inv.as_of_at if inv.as_of_at is not None else inv.updated_at
-    freshness_status, age_hours = freshness_from_timestamp(ts)
+    freshness_status, age_hours = freshness_from_timestamp(ts, now)
     if freshness_status not in ("warning", "critical") or age_hours is None:
-        return
+        return None
     last_ts_str = (inv.as_of_at or inv.updated_at).isoformat()
     severity = "critical" if freshness_status == "critical" else "warning"
     dedupe_key = f"inventory_stale:{marketplace}:{sku}:{severity}"
@@ -252,48 +363,48 @@ def _stale_inventory_alert_for_inv(
         f"SKU {sku}, marketplace {marketplace}: inventory data is {age_hours:.1f} hours old. "
         f"Last inventory timestamp: {last_ts_str}. Update or sync stock data for accurate restock alerts."
     )
-    evt = _try_create_alert(
-        db, "inventory_stale", severity, sku, marketplace, title, message, dedupe_key
+    return _alert_candidate(
+        "inventory_stale", severity, sku, marketplace, title, message, dedupe_key, now,
+        send_flag="send_inventory_stale",
+        subject=f"[Amazon Dashboard] {severity.upper()}: Inventory stale — {sku}",
+        view="/alerts",
     )
-    if evt:
-        created_ref[0] += 1
-        if settings_row.email_enabled and settings_row.send_inventory_stale:
-            recipients = _recipient_emails(db, settings_row)
-            if recipients:
-                subj = f"[Amazon Dashboard] {severity.upper()}: Inventory stale — {sku}"
-                body = f"{title}\n\n{message}\n\nCreated: {evt.created_at}\n\nView: /alerts"
-                if _send_alert_email(recipients, subj, body):
-                    emailed_ref[0] += 1
 
 
-def run_alert_generation_once(db: Session) -> dict[str, int]:
+def run_alert_generation_once(db: Session, *, background_email: bool = False) -> dict[str, int]:
     """
     Scan inventory, compute restock actions, create alert_events (deduped).
-    Optionally send emails per settings.
-    Returns {"created": N, "emailed": M}.
+    Optionally send emails per settings: inline on one SMTP session, or handed to the background
+    sender when background_email is set (POST /alerts/run, so the request doesn't wait on SMTP).
+    Returns {"created": N, "emailed": M, "email_queued": Q}; M counts emails actually sent,
+    Q those queued for the background sender (not yet delivered).
     """
-    created = 0
-    emailed = 0
-    created_ref = [0]
-    emailed_ref = [0]
     settings_row = get_or_create_settings(db)
-    today = date.today()
+    candidates: list[_AlertCandidate] = []
+    # One clock reading per run: stale ages, created_at and the order-by comparisons all agree.
+    now = datetime.now(timezone.utc)
+    today = now.astimezone().date()
 
     inventory_items = list_inventory(db, marketplace=None, q=None, limit=500)
+    # One query for every item's history instead of two per SKU inside the loop
+    history_by_pair = get_daily_units_bulk(
+        db, list({(inv.sku, inv.marketplace) for inv in inventory_items}), HISTORY_DAYS
+    )
     for inv in inventory_items:
         sku = inv.sku
         marketplace = inv.marketplace
-        stock_units = inv.available_units()
+        stock_units = float(inv.available_units)
 
         # Phase 11.4: stale inventory alert (hour-based; dedupe by sku+marketplace+severity)
-        _stale_inventory_alert_for_inv(db, inv, settings_row, created_ref, emailed_ref)
-        created = created_ref[0]
-        emailed = emailed_ref[0]
+        stale = _stale_inventory_alert_for_inv(inv, now)
+        if stale is not None:
+            candidates.append(stale)
 
         # Restock action for this SKU+marketplace
-        forecast_data = _forecast_sku_for_restock(db, sku, marketplace, HORIZON_DAYS)
-        if forecast_data is None:
+        history = history_by_pair.get((sku, marketplace))
+        if history is None:
             continue
+        forecast_data = _forecast_sku_for_restock(*history, HORIZON_DAYS)
 
 
         end_date = forecast_data["end_date"]
@@ -321,76 +432,83 @@ def run_alert_generation_once(db: Session) -> dict[str, int]:
         order_by_date = raw.get("order_by_date")
 
 
-        # 2) order_by_passed (critical) â€” check before urgent/watch so we emit one alert
+        # 2) order_by_passed (critical) — check before urgent/watch so we emit one alert
         if order_by_date is not None and order_by_date < today:
             ob_str = order_by_date.isoformat()
             dedupe_key = f"order_by_passed:{marketplace}:{sku}:{ob_str}"
-            title = f"Order-by date passed â€” {sku} ({marketplace})"
+            title = f"Order-by date passed — {sku} ({marketplace})"
             message = f"Recommended order-by date was {ob_str}. Reorder as soon as possible to avoid stockout."
-            evt = _try_create_alert(
-                db, "order_by_passed", "critical", sku, marketplace, title, message, dedupe_key
+            candidates.append(
+                _alert_candidate(
+                    "order_by_passed", "critical", sku, marketplace, title, message, dedupe_key, now,
+                    send_flag="send_order_by_passed",
+                    subject=f"[Amazon Dashboard] CRITICAL: Order-by date passed — {sku}",
+                    view="/restock",
+                )
             )
-            if evt:
-                created += 1
-                if (
-                    settings_row.email_enabled
-                    and settings_row.send_order_by_passed
-                ):
-                    recipients = _recipient_emails(db, settings_row)
-                    if recipients:
-                        subj = f"[Amazon Dashboard] CRITICAL: Order-by date passed â€” {sku}"
-                        body = f"{title}\n\n{message}\n\nCreated: {evt.created_at}\n\nView: /restock"
-                        if _send_alert_email(recipients, subj, body):
-                            emailed += 1
 
         # 3) urgent_restock
         if status == "urgent":
             ob_str = order_by_date.isoformat() if order_by_date else "N/A"
             dedupe_key = f"urgent_restock:{marketplace}:{sku}:{ob_str}"
-            title = f"Urgent restock â€” {sku} ({marketplace})"
+            title = f"Urgent restock — {sku} ({marketplace})"
             message = raw.get("recommendation") or "Reorder now to avoid stockout during lead time."
-            evt = _try_create_alert(
-                db, "urgent_restock", "critical", sku, marketplace, title, message, dedupe_key
+            candidates.append(
+                _alert_candidate(
+                    "urgent_restock", "critical", sku, marketplace, title, message, dedupe_key, now,
+                    send_flag="send_urgent_restock",
+                    subject=f"[Amazon Dashboard] CRITICAL: Urgent restock — {sku}",
+                    view="/restock",
+                )
             )
-            if evt:
-                created += 1
-                if (
-                    settings_row.email_enabled
-                    and settings_row.send_urgent_restock
-                ):
-                    recipients = _recipient_emails(db, settings_row)
-                    if recipients:
-                        subj = f"[Amazon Dashboard] CRITICAL: Urgent restock â€” {sku}"
-                        body = f"{title}\n\n{message}\n\nCreated: {evt.created_at}\n\nView: /restock"
-                        if _send_alert_email(recipients, subj, body):
-                            emailed += 1
 
         # 4) reorder_soon (watch)
         if status == "watch":
             ob_str = order_by_date.isoformat() if order_by_date else "N/A"
             dedupe_key = f"reorder_soon:{marketplace}:{sku}:{ob_str}"
-            title = f"Reorder soon â€” {sku} ({marketplace})"
+            title = f"Reorder soon — {sku} ({marketplace})"
             message = raw.get("recommendation") or "Reorder soon (within 7 days)."
-            evt = _try_create_alert(
-                db, "reorder_soon", "warning", sku, marketplace, title, message, dedupe_key
+            candidates.append(
+                _alert_candidate(
+                    "reorder_soon", "warning", sku, marketplace, title, message, dedupe_key, now,
+                    send_flag="send_reorder_soon",
+                    subject=f"[Amazon Dashboard] WARNING: Reorder soon — {sku}",
+                    view="/restock",
+                )
             )
-            if evt:
-                created += 1
-                if (
-                    settings_row.email_enabled
-                    and settings_row.send_reorder_soon
-                ):
-                    recipients = _recipient_emails(db, settings_row)
-                    if recipients:
-                        subj = f"[Amazon Dashboard] WARNING: Reorder soon â€” {sku}"
-                        body = f"{title}\n\n{message}\n\nCreated: {evt.created_at}\n\nView: /restock"
-                        if _send_alert_email(recipients, subj, body):
-                            emailed += 1
 
+    # One INSERT ... ON CONFLICT DO NOTHING for the whole scan instead of a savepoint per alert
     try:
+        inserted = _bulk_create_alerts(db, candidates)
         db.commit()
     except Exception:
         db.rollback()
         raise
 
-    return {"created": created, "emailed": emailed}
+    created = len(inserted)
+    emails: list[tuple[list[str], str, str]] = []
+    recipients: list[str] | None = None
+    if settings_row.email_enabled and getattr(settings, "smtp_host", None):
+        for c in candidates:
+            if c.values["dedupe_hash"] not in inserted or not getattr(settings_row, c.send_flag):
+                continue
+            inserted.discard(c.values["dedupe_hash"])  # a key repeated in one scan mails once
+            if recipients is None:
+                recipients = _recipient_emails(db, settings_row)
+            if recipients:
+                body = f"{c.values['title']}\n\n{c.values['message']}\n\nCreated: {now}\n\nView: {c.view}"
+                emails.append((recipients, c.subject, body))
+
+    emailed = 0
+    if background_email:
+        for email in emails:
+            _enqueue_alert_email(*email)
+    elif emails:
+        with AlertMailer() as mailer:
+            emailed = sum(mailer.send(*email) for email in emails)
+
+    return {
+        "created": created,
+        "emailed": emailed,
+        "email_queued": len(emails) if background_email else 0,
+    }
@@ -23,6 +23,7 @@ from app.models.amazon_order_item import AmazonOrderItem
 from app.models.marketplace import Marketplace
 from app.models.order_item import OrderItem
 from app.models.product import Product
+from app.services.timeseries import refresh_daily_units
 
 logger = logging.getLogger(__name__)
 
@@ -441,6 +442,10 @@ def run_order_items_sync(
                 _upsert_amazon_order_item(db, item, amazon_order_id, marketplace_id)
         _bridge_to_order_items(db, connection, amazon_order_id, marketplace_id, order_date, items)
         items_count += len(items)
+    if items_count > 0:
+        # Bridged rows feed daily_units_mv (timeseries); refresh within the caller's transaction.
+        db.flush()
+        refresh_daily_units(db)
     logger.info(
         "items_sync_success",
         extra={"connection_id": connection.id, "items_count": items_count, "orders_failed": orders_failed},
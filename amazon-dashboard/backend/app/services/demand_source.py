@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from app.schemas.data_quality import DataQualitySeverity
 from app.services.timeseries import (
+    DemandMeta,
     get_daily_units_by_sku,
     get_daily_units_by_sku_mapped,
     get_daily_units_total,
@@ -79,6 +80,61 @@ def _build_warnings(
     return warnings
 
 
+def _restock_meta_from_mapped(
+    mode: DemandMode,
+    series: list[tuple[date, int]],
+    demand_meta: DemandMeta,
+    *,
+    sku: str | None = None,
+) -> RestockDemandMeta:
+    """Build RestockDemandMeta (share, warnings, severity) from a mapped series and its DemandMeta."""
+    total_units = sum(u for _, u in series)
+    total_all = total_units + demand_meta.excluded_units + demand_meta.unmapped_units
+    if total_all > 0:
+        unmapped_share = demand_meta.unmapped_units / total_all
+    else:
+        unmapped_share = 0.0
+
+    warnings = _build_warnings(
+        mode,
+        demand_meta.excluded_units,
+        unmapped_share,
+        total_units,
+    )
+    for w in warnings:
+        if sku is None:
+            logger.info("restock demand total: %s", w)
+        else:
+            logger.info("restock demand sku=%s: %s", sku, w)
+
+    return RestockDemandMeta(
+        mode=mode,
+        excluded_units=demand_meta.excluded_units,
+        excluded_skus=demand_meta.excluded_skus,
+        unmapped_units_30d=demand_meta.unmapped_units,
+        unmapped_share_30d=round(unmapped_share, 4),
+        ignored_units_30d=demand_meta.ignored_units,
+        discontinued_units_30d=demand_meta.discontinued_units,
+        warnings=warnings,
+        severity=_compute_severity(unmapped_share, demand_meta.excluded_units, total_units),
+    )
+
+
+def restock_meta_for_sku_series(
+    sku: str,
+    series: list[tuple[date, int]],
+    demand_meta: DemandMeta,
+    *,
+    include_unmapped: bool = False,
+) -> RestockDemandMeta:
+    """
+    RestockDemandMeta for a mapped SKU series fetched elsewhere (e.g. timeseries.fetch_sku_bundle).
+    Same rules as get_demand_series_for_restock_sku in mapped mode.
+    """
+    mode = _mode_from_include_unmapped(include_unmapped)
+    return _restock_meta_from_mapped(mode, series, demand_meta, sku=sku)
+
+
 def get_demand_series_for_restock_total(
     db: Session,
     marketplace_code: str,
@@ -123,34 +179,7 @@ def get_demand_series_for_restock_total(
         marketplace_code if marketplace_code != "ALL" else None,
         include_unmapped=(mode == "mapped_include_unmapped"),
     )
-    total_units = sum(u for _, u in series)
-    total_all = total_units + demand_meta.excluded_units + demand_meta.unmapped_units
-    if total_all > 0:
-        unmapped_share = demand_meta.unmapped_units / total_all
-    else:
-        unmapped_share = 0.0
-
-    warnings = _build_warnings(
-        mode,
-        demand_meta.excluded_units,
-        unmapped_share,
-        total_units,
-    )
-    for w in warnings:
-        logger.info("restock demand total: %s", w)
-
-    meta = RestockDemandMeta(
-        mode=mode,
-        excluded_units=demand_meta.excluded_units,
-        excluded_skus=demand_meta.excluded_skus,
-        unmapped_units_30d=demand_meta.unmapped_units,
-        unmapped_share_30d=round(unmapped_share, 4),
-        ignored_units_30d=demand_meta.ignored_units,
-        discontinued_units_30d=demand_meta.discontinued_units,
-        warnings=warnings,
-        severity=_compute_severity(unmapped_share, demand_meta.excluded_units, total_units),
-    )
-    return (series, meta)
+    return (series, _restock_meta_from_mapped(mode, series, demand_meta))
 
 
 def get_demand_series_for_restock_sku(
@@ -198,31 +227,4 @@ def get_demand_series_for_restock_sku(
         marketplace_code if marketplace_code != "ALL" else None,
         include_unmapped=(mode == "mapped_include_unmapped"),
     )
-    total_units = sum(u for _, u in series)
-    total_all = total_units + demand_meta.excluded_units + demand_meta.unmapped_units
-    if total_all > 0:
-        unmapped_share = demand_meta.unmapped_units / total_all
-    else:
-        unmapped_share = 0.0
-
-    warnings = _build_warnings(
-        mode,
-        demand_meta.excluded_units,
-        unmapped_share,
-        total_units,
-    )
-    for w in warnings:
-        logger.info("restock demand sku=%s: %s", sku, w)
-
-    meta = RestockDemandMeta(
-        mode=mode,
-        excluded_units=demand_meta.excluded_units,
-        excluded_skus=demand_meta.excluded_skus,
-        unmapped_units_30d=demand_meta.unmapped_units,
-        unmapped_share_30d=round(unmapped_share, 4),
-        ignored_units_30d=demand_meta.ignored_units,
-        discontinued_units_30d=demand_meta.discontinued_units,
-        warnings=warnings,
-        severity=_compute_severity(unmapped_share, demand_meta.excluded_units, total_units),
-    )
-    return (series, meta)
+    return (series, _restock_meta_from_mapped(mode, series, demand_meta, sku=sku))
@@ -6,7 +6,9 @@ Logic is conservative and explainable.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Literal
 
 import numpy as np
@@ -48,19 +50,16 @@ _TREND_INCREASING_RATIO = 1.10
 _TREND_DECREASING_RATIO = 0.90
 
 
-def _detect_trend(history_daily_units: list[float]) -> TrendType:
+def _detect_trend(arr: np.ndarray) -> TrendType:
     """
-    Compare recent 14-day mean vs preceding 14-day mean.
+    Compare recent 14-day mean vs preceding 14-day mean (arr: float64 daily units).
     Requires at least 28 days of history.
     """
-    arr = np.array(history_daily_units, dtype=float)
     if len(arr) < _TREND_MIN_DAYS:
         return "insufficient_data"
 
-    recent = arr[-14:]
-    older = arr[-28:-14]
-    recent_mean = float(np.mean(recent))
-    older_mean = float(np.mean(older))
+    recent_mean = float(arr[-14:].mean())
+    older_mean = float(arr[-28:-14].mean())
 
     # Avoid division by zero; treat near-zero older as stable
     if older_mean < 1e-6:
@@ -88,15 +87,14 @@ def _classify_confidence(mape_30d: float | None) -> ConfidenceType:
     return "low"
 
 
-def _compute_volatility_cv(history_daily_units: list[float]) -> float:
-    """Coefficient of variation: std / mean. Returns 0 if mean is near zero."""
-    arr = np.array(history_daily_units, dtype=float)
+def _compute_volatility_cv(arr: np.ndarray) -> float:
+    """Coefficient of variation of arr (float64 daily units): std / mean. Returns 0 if mean is near zero."""
     if len(arr) < 2:
         return 0.0
-    mean_val = float(np.mean(arr))
+    mean_val = float(arr.mean())
     if mean_val < 1e-6:
         return 0.0
-    std_val = float(np.std(arr))
+    std_val = float(arr.std())
     return std_val / mean_val
 
 
@@ -198,7 +196,7 @@ def _build_recommendation_and_reasoning(
 
 
 def build_intelligence(
-    history_daily_units: list[float],
+    history_daily_units: Sequence[float] | np.ndarray,
     forecast_expected_total: float,
     horizon_days: int,
     mape_30d: float | None,
@@ -209,7 +207,7 @@ def build_intelligence(
     Build forecast intelligence from history and forecast outputs.
 
     Args:
-        history_daily_units: Daily units in chronological order.
+        history_daily_units: Daily units in chronological order (list or float ndarray).
         forecast_expected_total: Sum of predicted units over horizon.
         horizon_days: Forecast horizon in days.
         mape_30d: 30-day backtest MAPE, or None.
@@ -219,9 +217,29 @@ def build_intelligence(
     Returns:
         IntelligenceResult with trend, confidence, estimates, and recommendation.
     """
-    trend = _detect_trend(history_daily_units)
+    # Memoized on the exact inputs: the alert scan and repeated requests see the same histories
+    # (e.g. all-zero SKUs) over and over. reasoning is copied so callers never share the cached list.
+    arr = np.ascontiguousarray(history_daily_units, dtype=np.float64)
+    result = _build_intelligence_cached(
+        arr.tobytes(), forecast_expected_total, horizon_days, mape_30d,
+        lead_time_days, current_stock_units,
+    )
+    return replace(result, reasoning=list(result.reasoning))
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _build_intelligence_cached(
+    history_bytes: bytes,
+    forecast_expected_total: float,
+    horizon_days: int,
+    mape_30d: float | None,
+    lead_time_days: int | None,
+    current_stock_units: float | None,
+) -> IntelligenceResult:
+    arr = np.frombuffer(history_bytes, dtype=np.float64)
+    trend = _detect_trend(arr)
     confidence = _classify_confidence(mape_30d)
-    volatility_cv = _compute_volatility_cv(history_daily_units)
+    volatility_cv = _compute_volatility_cv(arr)
 
     daily_demand_estimate = (
         forecast_expected_total / horizon_days if horizon_days > 0 else 0.0
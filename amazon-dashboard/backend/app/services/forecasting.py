@@ -1,9 +1,21 @@
-"""Baseline forecasting: seasonal naive weekly and moving average 7."""
+"""
+Baseline forecasting: seasonal naive weekly and moving average 7.
+
+The dense-array helpers used by the alert scan and restock paths are NumPy only; pandas is
+imported inside the Series-based functions, so importing this module does not load pandas.
+"""
 from __future__ import annotations
 
 from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Structured dtype for a daily (date, units) history: one C-level pass over the point list.
+_POINTS_DTYPE = np.dtype([("date", "datetime64[D]"), ("units", np.float64)])
 
 
 def safe_mape(actuals: list[float], preds: list[float]) -> float:
@@ -20,13 +32,92 @@ def safe_mape(actuals: list[float], preds: list[float]) -> float:
     return float(sum(errors) / len(errors))
 
 
+def points_to_arrays(points: list[tuple[date, int]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert (date, units) points to parallel arrays in a single pass.
+    Returns (dates as datetime64[D], units as float64); both empty when points is empty.
+    """
+    arr = np.array(points, dtype=_POINTS_DTYPE)
+    return arr["date"], arr["units"]
+
+
+def units_from_points(points: list[tuple[date, int]]) -> np.ndarray:
+    """
+    Units of (date, units) points as float64, for callers that don't need the dates.
+    Much cheaper than points_to_arrays: converting date objects to datetime64 dominates that.
+    """
+    return np.fromiter((u for _, u in points), dtype=np.float64, count=len(points))
+
+
+def dense_history_array(points: list[tuple[date, int]], start: date, end: date) -> np.ndarray:
+    """
+    Units of (date, units) points as a dense float64 array with one slot per day from start to
+    end inclusive: arr[(d - start).days] = u; days without a point (or outside the range) are 0.
+    """
+    arr = np.zeros(max((end - start).days + 1, 0), dtype=np.float64)
+    if not points:
+        return arr
+    idx = np.fromiter(((d - start).days for d, _ in points), dtype=np.int64, count=len(points))
+    keep = (idx >= 0) & (idx < len(arr))
+    arr[idx[keep]] = units_from_points(points)[keep]
+    return arr
+
+
+def series_from_arrays(dates: np.ndarray, units: np.ndarray) -> pd.Series:
+    """Build a pandas Series indexed by date from parallel arrays (see points_to_arrays)."""
+    import pandas as pd
+
+    if len(units) == 0:
+        return pd.Series(dtype=float)
+    return pd.Series(units, index=pd.DatetimeIndex(dates)).sort_index()
+
+
 def _series_from_points(points: list[tuple[date, int]]) -> pd.Series:
     """Build a pandas Series indexed by date from (date, units) list. Fills missing days with 0."""
+    import pandas as pd
+
     if not points:
         return pd.Series(dtype=float)
-    dates = [p[0] for p in points]
-    units = [p[1] for p in points]
-    return pd.Series(units, index=pd.DatetimeIndex(dates)).sort_index()
+    index = pd.DatetimeIndex([p[0] for p in points])
+    units = np.fromiter((p[1] for p in points), dtype=np.int64, count=len(points))
+    series = pd.Series(units, index=index)
+    # The timeseries helpers return points in date order; only sort when they are not.
+    return series if index.is_monotonic_increasing else series.sort_index()
+
+
+def _tail_7d_mean(dates: np.ndarray, values: np.ndarray, end: int) -> float:
+    """
+    series.iloc[:end].last("7D").mean() on sorted arrays: mean over the 7 calendar days ending
+    at position end-1, else the mean of values[:end], else 0. One searchsorted, no pandas.
+    """
+    lo = int(np.searchsorted(dates[:end], dates[end - 1] - np.timedelta64(7, "D"), side="right"))
+    for window in (values[lo:end], values[:end]):
+        window = window[~np.isnan(window)]
+        if len(window) > 0:
+            return float(window.mean())
+    return 0.0
+
+
+def seasonal_naive_weekly_values(
+    dates: np.ndarray, units: np.ndarray, horizon_days: int
+) -> np.ndarray:
+    """
+    Pure-NumPy seasonal_naive_weekly on parallel arrays (see points_to_arrays).
+    Forecast for day k after the last date = units at (last + k - 7) when that day is in
+    the history, else the mean of the history. Returns float64 values for the next horizon_days.
+    """
+    if len(units) == 0 or horizon_days <= 0:
+        return np.empty(0, dtype=np.float64)
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order].astype("datetime64[D]")
+    units = units[order].astype(np.float64, copy=False)
+    valid = ~np.isnan(units)
+    mean_val = float(units[valid].mean()) if valid.any() else 0.0
+    # t-7 for every forecast day, located in the sorted history with one searchsorted
+    lag_dates = dates[-1] + np.arange(1 - 7, horizon_days + 1 - 7)
+    pos = np.minimum(np.searchsorted(dates, lag_dates), len(dates) - 1)
+    lagged = np.where(dates[pos] == lag_dates, units[pos], np.nan)
+    return np.where(np.isnan(lagged), mean_val, lagged)
 
 
 def seasonal_naive_weekly(series: pd.Series, horizon_days: int) -> pd.Series:
@@ -35,54 +126,95 @@ def seasonal_naive_weekly(series: pd.Series, horizon_days: int) -> pd.Series:
     If insufficient history, fall back to mean of available.
     Returns a Series of forecast values indexed by date (next horizon_days).
     """
+    import pandas as pd
+
     if series.empty or horizon_days <= 0:
         return pd.Series(dtype=float)
 
-    last_date = series.index.max()
-    if not isinstance(last_date, date):
-        last_date = last_date.date() if hasattr(last_date, "date") else last_date
-
-    mean_val = float(series.mean()) if series.notna().any() else 0.0
-    out_dates = [last_date + timedelta(days=i) for i in range(1, horizon_days + 1)]
-    forecasts = []
-
-    for d in out_dates:
-        lookback = d - timedelta(days=7)
-        lookback_ts = pd.Timestamp(lookback)
-        if lookback_ts in series.index and pd.notna(series.loc[lookback_ts]):
-            forecasts.append(float(series.loc[lookback_ts]))
-        else:
-            forecasts.append(mean_val)
-
-    return pd.Series(forecasts, index=pd.DatetimeIndex(out_dates))
+    dates = series.index.to_numpy(dtype="datetime64[D]")
+    forecasts = seasonal_naive_weekly_values(dates, series.to_numpy(dtype=np.float64), horizon_days)
+    out_index = pd.DatetimeIndex((dates.max() + np.arange(1, horizon_days + 1)).astype("datetime64[ns]"))
+    return pd.Series(forecasts, index=out_index)
 
 
 def moving_average_7(series: pd.Series, horizon_days: int) -> pd.Series:
     """
     Forecast = rolling mean over last 7 days. Constant forecast for entire horizon.
     """
+    import pandas as pd
+
     if series.empty or horizon_days <= 0:
         return pd.Series(dtype=float)
 
-    last = series.last("7D")
-    mean_val = float(last.mean()) if len(last) > 0 and last.notna().any() else float(series.mean()) if series.notna().any() else 0.0
+    series = series.sort_index()
+    mean_val = _tail_7d_mean(
+        series.index.to_numpy(), series.to_numpy(dtype=np.float64), len(series)
+    )
 
-    last_date = series.index.max()
-    if hasattr(last_date, "date"):
-        last_date = last_date.date()
-    out_dates = [last_date + timedelta(days=i) for i in range(1, horizon_days + 1)]
-    return pd.Series([mean_val] * horizon_days, index=pd.DatetimeIndex(out_dates))
+    last_date = series.index.to_numpy(dtype="datetime64[D]")[-1]
+    out_index = pd.DatetimeIndex((last_date + np.arange(1, horizon_days + 1)).astype("datetime64[ns]"))
+    return pd.Series(np.full(horizon_days, mean_val), index=out_index)
+
+
+def seasonal_naive_dense_values(units: np.ndarray, horizon_days: int) -> np.ndarray:
+    """
+    seasonal_naive_weekly for a dense history (units[i] is day i, consecutive days, see
+    dense_history_array): forecast day k repeats day n-1+k-7 while that is inside the
+    history, else the mean of the history. Returns float64 values for the next horizon_days.
+    """
+    units = np.asarray(units, dtype=np.float64)
+    n = len(units)
+    if n == 0 or horizon_days <= 0:
+        return np.empty(0, dtype=np.float64)
+    lag_pos = np.arange(n - 7, n - 7 + horizon_days)
+    in_hist = (lag_pos >= 0) & (lag_pos < n)
+    return np.where(in_hist, units[np.clip(lag_pos, 0, n - 1)], units.mean())
+
+
+def snaive_backtest_and_forecast(
+    units: np.ndarray, horizon_days: int
+) -> tuple[float, float, float]:
+    """
+    backtest_30d(use_seasonal_naive=True) and seasonal_naive_weekly(...).sum() fused into one
+    NumPy pass, for a dense history: units[i] is day i, consecutive days, zero-filled (as the
+    timeseries helpers return). Returns (mae_30d, mape_30d, forecast_expected_total) with the
+    same values as the separate pandas calls.
+    """
+    units = np.asarray(units, dtype=np.float64)
+    if not units.any():
+        # No sales in the window (the cold tail of a catalog scan): every prediction and error is 0.
+        return (0.0, 0.0, 0.0)
+    n = len(units)
+    forecast_total = float(seasonal_naive_dense_values(units, horizon_days).sum())
+
+    if n < 8:
+        return (0.0, 0.0, forecast_total)
+    # Last 30 days, never the first day; t-7 where it exists, else mean of all earlier days.
+    pos = np.arange(max(n - 30, 1), n)
+    preds = np.empty(len(pos), dtype=np.float64)
+    has_lag = pos >= 7
+    preds[has_lag] = units[pos[has_lag] - 7]
+    cum = np.cumsum(units)
+    preds[~has_lag] = cum[pos[~has_lag] - 1] / pos[~has_lag]
+    actuals = units[pos]
+    mae_30d = float(np.mean(np.abs(actuals - preds)))
+    mape_30d = safe_mape(actuals.tolist(), preds.tolist())
+    return (mae_30d, mape_30d, forecast_total)
 
 
 def backtest_30d(
     points: list[tuple[date, int]],
     use_seasonal_naive: bool = True,
+    series: pd.Series | None = None,
 ) -> tuple[float, float, list[dict]]:
     """
     Evaluate MAE and MAPE over the last 30 days; return backtest points.
     For each day t in last 30 days: predicted = seasonal naive (t-7) if available else moving average.
+    Pass `series` when the caller already built it from `points` to skip rebuilding it here.
     Returns (mae_30d, mape_30d, backtest_points) where backtest_points are {date, actual_units, predicted_units}.
     """
+    import pandas as pd
+
     mae_30d = 0.0
     mape_30d = 0.0
     backtest_points: list[dict] = []
@@ -90,42 +222,39 @@ def backtest_30d(
     if len(points) < 8:
         return (mae_30d, mape_30d, backtest_points)
 
-    series = _series_from_points(points)
+    if series is None:
+        series = _series_from_points(points)
     series = series.sort_index()
     last_30_start = series.index.max() - timedelta(days=29)
-    eval_series = series[series.index >= last_30_start]
-
-    actuals: list[float] = []
-    preds: list[float] = []
-
-    for eval_date in eval_series.index:
-        eval_d = eval_date.date() if hasattr(eval_date, "date") else eval_date
-        hist = series[series.index < eval_date]
-        if hist.empty:
-            continue
-        actual = float(series.loc[eval_date])
-        lookback = eval_d - timedelta(days=7)
-        lookback_ts = pd.Timestamp(lookback)
-        if use_seasonal_naive and lookback_ts in hist.index and pd.notna(hist.loc[lookback_ts]):
-            predicted = float(hist.loc[lookback_ts])
-        else:
-            last_7 = hist.last("7D")
-            predicted = (
-                float(last_7.mean())
-                if len(last_7) > 0 and last_7.notna().any()
-                else float(hist.mean()) if hist.notna().any() else 0.0
-            )
-        actuals.append(actual)
-        preds.append(predicted)
-        backtest_points.append({
-            "date": eval_d.isoformat(),
-            "actual_units": int(actual),
-            "predicted_units": round(predicted, 4),
-        })
-
-    if actuals and preds:
-        errors_abs = [abs(a - p) for a, p in zip(actuals, preds)]
-        mae_30d = float(sum(errors_abs) / len(errors_abs))
-        mape_30d = safe_mape(actuals, preds)
+    values = series.to_numpy(dtype=np.float64)
+    # Day t needs at least one earlier point, so the first row of the series is never evaluated.
+    eval_pos = np.flatnonzero(series.index >= last_30_start)
+    eval_pos = eval_pos[eval_pos > 0]
+    if len(eval_pos) == 0:
+        return (mae_30d, mape_30d, backtest_points)
+    eval_index = series.index[eval_pos]
+    actuals = values[eval_pos]
+
+    if use_seasonal_naive:
+        preds = series.reindex(eval_index - pd.Timedelta(days=7)).to_numpy(dtype=np.float64)
+    else:
+        preds = np.full(len(eval_pos), np.nan)
+    # Moving-average fallback only for days whose t-7 value is missing.
+    index_values = series.index.to_numpy()
+    for i in np.flatnonzero(np.isnan(preds)):
+        preds[i] = _tail_7d_mean(index_values, values, eval_pos[i])
+
+    eval_dates = np.datetime_as_string(eval_index.to_numpy(dtype="datetime64[D]"))
+    backtest_points = [
+        {
+            "date": str(d),
+            "actual_units": int(a),
+            "predicted_units": round(float(p), 4),
+        }
+        for d, a, p in zip(eval_dates, actuals, preds)
+    ]
+
+    mae_30d = float(np.mean(np.abs(actuals - preds)))
+    mape_30d = safe_mape(actuals.tolist(), preds.tolist())
 
     return (mae_30d, mape_30d, backtest_points)
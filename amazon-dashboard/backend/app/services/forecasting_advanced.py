@@ -11,6 +11,7 @@ import pandas as pd
 
 from app.services.forecasting import (
     _series_from_points,
+    _tail_7d_mean,
     backtest_30d,
     safe_mape,
     seasonal_naive_weekly,
@@ -87,10 +88,8 @@ def _level_trend_baseline(series: pd.Series) -> float:
     """Simple level: 7-day moving average at end, or mean if too short."""
     if series.empty:
         return 0.0
-    last = series.last("7D")
-    if len(last) > 0 and last.notna().any():
-        return float(last.mean())
-    return float(series.mean()) if series.notna().any() else 0.0
+    series = series.sort_index()
+    return _tail_7d_mean(series.index.to_numpy(), series.to_numpy(dtype=np.float64), len(series))
 
 
 def seasonality_forecast(
@@ -134,12 +133,17 @@ def confidence_bounds_from_backtest(
     forecast_series: pd.Series,
     use_seasonal_naive: bool = True,
     z: float = CONFIDENCE_Z,
+    *,
+    backtest: tuple[float, float, list[dict]] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Use residuals from backtest_30d to estimate std; per-day bounds = forecast ± z*std, floor 0.
+    Pass `backtest` when the caller already ran backtest_30d on `points` with the same model.
     Returns list of {date, predicted_units, lower, upper}.
     """
-    mae_30d, _, backtest_points = backtest_30d(points, use_seasonal_naive=use_seasonal_naive)
+    if backtest is None:
+        backtest = backtest_30d(points, use_seasonal_naive=use_seasonal_naive)
+    mae_30d, _, backtest_points = backtest
     residuals = [
         abs(p["actual_units"] - p["predicted_units"])
         for p in backtest_points
@@ -173,10 +177,14 @@ def detect_drift(
     use_seasonal_naive: bool = True,
     window_days: int = DRIFT_WINDOW_DAYS,
     mape_threshold_multiplier: float = DRIFT_MAPE_THRESHOLD_MULTIPLIER,
+    *,
+    series: pd.Series | None = None,
+    backtest: tuple[float, float, list[dict]] | None = None,
 ) -> DriftResult:
     """
     Compare last `window_days` actuals vs predicted (same model as backtest).
     Flag drift if MAPE in window exceeds (historical backtest MAPE * multiplier).
+    Pass `series` / `backtest` when the caller already built them from `points` to skip redoing it.
     """
     if len(points) < window_days + 7:
         return DriftResult(
@@ -186,14 +194,20 @@ def detect_drift(
             mape=0.0,
             threshold_mape=0.0,
         )
-    mae_30d, mape_30d, _ = backtest_30d(points, use_seasonal_naive=use_seasonal_naive)
-    series = _series_from_points(points)
+    if series is None:
+        series = _series_from_points(points)
+    if backtest is None:
+        backtest = backtest_30d(points, use_seasonal_naive=use_seasonal_naive, series=series)
+    mae_30d, mape_30d, _ = backtest
     series = series.sort_index()
     last_n_start = series.index.max() - timedelta(days=window_days - 1)
     eval_series = series[series.index >= last_n_start]
+    index_values = series.index.to_numpy()
+    values = series.to_numpy(dtype=np.float64)
+    first_eval = len(series) - len(eval_series)
     actuals: list[float] = []
     preds: list[float] = []
-    for eval_date in eval_series.index:
+    for offset, eval_date in enumerate(eval_series.index):
         eval_d = _to_date(eval_date)
         hist = series[series.index < eval_date]
         if hist.empty:
@@ -204,12 +218,7 @@ def detect_drift(
         if use_seasonal_naive and lookback_ts in hist.index and pd.notna(hist.loc[lookback_ts]):
             predicted = float(hist.loc[lookback_ts])
         else:
-            last_7 = hist.last("7D")
-            predicted = (
-                float(last_7.mean())
-                if len(last_7) > 0 and last_7.notna().any()
-                else float(hist.mean()) if hist.notna().any() else 0.0
-            )
+            predicted = _tail_7d_mean(index_values, values, first_eval + offset)
         actuals.append(actual)
         preds.append(predicted)
     if not actuals or not preds:
@@ -326,11 +335,21 @@ def run_advanced_forecast(
     Returns (forecast_series, confidence_bounds, drift_result, applied_overrides, mae_30d, mape_30d, backtest_points).
     """
     overrides = overrides or []
+    # One series and one backtest, shared by the bounds and drift steps (same model throughout).
     series = _series_from_points(points)
-    mae_30d, mape_30d, backtest_points = backtest_30d(points, use_seasonal_naive=True)
+    backtest = backtest_30d(points, use_seasonal_naive=True, series=series)
+    mae_30d, mape_30d, backtest_points = backtest
     forecast_series = seasonality_forecast(series, horizon_days, cap_spikes=cap_spikes)
-    bounds = confidence_bounds_from_backtest(points, forecast_series, use_seasonal_naive=True)
-    drift_result = detect_drift(points, use_seasonal_naive=True, window_days=DRIFT_WINDOW_DAYS)
+    bounds = confidence_bounds_from_backtest(
+        points, forecast_series, use_seasonal_naive=True, backtest=backtest
+    )
+    drift_result = detect_drift(
+        points,
+        use_seasonal_naive=True,
+        window_days=DRIFT_WINDOW_DAYS,
+        series=series,
+        backtest=backtest,
+    )
     forecast_series, bounds, applied = apply_overrides(forecast_series, bounds, overrides)
     return (
         forecast_series,
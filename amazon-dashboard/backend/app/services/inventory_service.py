@@ -9,11 +9,12 @@ get_on_hand_for_restock returns (on_hand, source, warning) for restock/forecast
 """
 from __future__ import annotations
 
-import math
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Literal
 
-from sqlalchemy import select
+from sqlalchemy import Row, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -43,8 +44,9 @@ def get_inventory(
     Phase 11.3: Prefer source='spapi', then latest as_of_at, so restock/forecast
     see SP-API data when present without changing callers.
     """
-    stmt = (
-        select(InventoryLevel)
+    # lambda_stmt: statement construction and compilation are cached; sku/marketplace bind per call
+    stmt = lambda_stmt(
+        lambda: select(InventoryLevel)
         .where(
             InventoryLevel.sku == sku,
             InventoryLevel.marketplace == marketplace,
@@ -62,9 +64,11 @@ def get_inventory(
 def get_inventory_by_source_key(db: Session, source: str, source_key: str) -> InventoryLevel | None:
     """Return inventory level by (source, source_key) for idempotent upsert."""
     return db.scalar(
-        select(InventoryLevel).where(
-            InventoryLevel.source == source,
-            InventoryLevel.source_key == source_key,
+        lambda_stmt(
+            lambda: select(InventoryLevel).where(
+                InventoryLevel.source == source,
+                InventoryLevel.source_key == source_key,
+            )
         )
     )
 
@@ -76,31 +80,60 @@ def upsert_inventory(db: Session, data: InventoryUpsertRequest) -> InventoryLeve
     Phase 11.5: Manual endpoints must only act on source='manual'. Spapi rows are read-only
     to manual API — we never overwrite or delete them. We only look up by (SOURCE_MANUAL, manual_key).
     """
-    source_key = _manual_source_key(data.sku, data.marketplace)
-    row = get_inventory_by_source_key(db, SOURCE_MANUAL, source_key)
+    return bulk_upsert_inventory(db, [data])[0]
+
+
+# Rows per INSERT ... ON CONFLICT statement in bulk_upsert_inventory.
+UPSERT_BATCH_SIZE = 1000
+
+
+def bulk_upsert_inventory(
+    db: Session, items: Sequence[InventoryUpsertRequest]
+) -> list[InventoryLevel]:
+    """
+    Create or update many manual inventory levels with one commit (same rules as upsert_inventory).
+
+    One INSERT ... ON CONFLICT (source, source_key) DO UPDATE ... RETURNING per
+    UPSERT_BATCH_SIZE rows instead of SELECT, then INSERT or UPDATE, then refresh per row.
+    A (sku, marketplace) repeated in items keeps its last entry, as sequential upserts would.
+    Returns the written rows (one per distinct sku+marketplace, in no particular order).
+    """
     now = datetime.now(timezone.utc)
-    if row is None:
-        row = InventoryLevel(
-            sku=data.sku,
-            marketplace=data.marketplace,
-            on_hand_units=data.on_hand_units,
-            reserved_units=data.reserved_units or 0,
-            source=SOURCE_MANUAL,
-            source_key=source_key,
-            as_of_at=now,
-            note=data.note,
+    by_key: dict[str, dict] = {}
+    for data in items:
+        source_key = _manual_source_key(data.sku, data.marketplace)
+        by_key.pop(source_key, None)
+        by_key[source_key] = {
+            "sku": data.sku,
+            "marketplace": data.marketplace,
+            "on_hand_units": data.on_hand_units,
+            "reserved_units": data.reserved_units or 0,
+            "source": SOURCE_MANUAL,
+            "source_key": source_key,
+            "as_of_at": now,
+            "note": data.note,
+        }
+    values = list(by_key.values())
+    rows: list[InventoryLevel] = []
+    for i in range(0, len(values), UPSERT_BATCH_SIZE):
+        stmt = pg_insert(InventoryLevel).values(values[i : i + UPSERT_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_inventory_levels_source_source_key",
+            set_={
+                "on_hand_units": stmt.excluded.on_hand_units,
+                "reserved_units": stmt.excluded.reserved_units,
+                "note": stmt.excluded.note,
+                "as_of_at": stmt.excluded.as_of_at,
+                "updated_at": now,
+            },
+        ).returning(InventoryLevel)
+        rows.extend(
+            db.scalars(
+                select(InventoryLevel).from_statement(stmt).execution_options(populate_existing=True)
+            ).all()
         )
-        db.add(row)
-        db.flush()
-    else:
-        row.on_hand_units = data.on_hand_units
-        row.reserved_units = data.reserved_units or 0
-        row.note = data.note
-        row.as_of_at = now
-        row.updated_at = now
     db.commit()
-    db.refresh(row)
-    return row
+    return rows
 
 
 def list_inventory(
@@ -108,36 +141,32 @@ def list_inventory(
     marketplace: str | None = None,
     q: str | None = None,
     limit: int = 200,
-) -> list[InventoryLevel]:
+) -> Sequence[Row]:
     """
     List inventory levels with optional marketplace and SKU substring filter.
 
     Phase 11.3: Returns one row per (sku, marketplace) — the best row (prefer spapi,
-    then latest as_of_at). Fetches more rows then dedupes so limit applies to result count.
+    then latest as_of_at). DISTINCT ON picks it in Postgres, so LIMIT applies to the result
+    count directly. Returns plain column rows (attribute access like InventoryLevel): every
+    caller only reads them.
     """
-    stmt = select(InventoryLevel).order_by(
-        InventoryLevel.marketplace,
-        InventoryLevel.sku,
-        (InventoryLevel.source == SOURCE_SPAPI).desc(),
-        InventoryLevel.as_of_at.desc().nulls_last(),
+    table = InventoryLevel.__table__
+    stmt = (
+        select(table)
+        .distinct(table.c.marketplace, table.c.sku)
+        .order_by(
+            table.c.marketplace,
+            table.c.sku,
+            (table.c.source == SOURCE_SPAPI).desc(),
+            table.c.as_of_at.desc().nulls_last(),
+        )
     )
     if marketplace is not None and marketplace != "":
-        stmt = stmt.where(InventoryLevel.marketplace == marketplace)
+        stmt = stmt.where(table.c.marketplace == marketplace)
     if q is not None and q.strip() != "":
-        stmt = stmt.where(InventoryLevel.sku.ilike(f"%{q.strip()}%"))
-    stmt = stmt.limit(max(1, min(limit, 500)) * 2)
-    rows = list(db.scalars(stmt).all())
-    seen: set[tuple[str, str]] = set()
-    result: list[InventoryLevel] = []
-    for row in rows:
-        key = (row.sku, row.marketplace)
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(row)
-        if len(result) >= max(1, min(limit, 500)):
-            break
-    return result
+        stmt = stmt.where(table.c.sku.ilike(f"%{q.strip()}%"))
+    stmt = stmt.limit(max(1, min(limit, 500)))
+    return db.execute(stmt).all()
 
 
 def delete_inventory(db: Session, sku: str, marketplace: str) -> None:
@@ -160,33 +189,37 @@ def get_on_hand_for_restock(
     Phase 11.5: Single source of truth for on-hand in restock/forecast.
 
     Returns (on_hand_units, source, warning_message).
-    - If a row exists (spapi preferred, then manual): (available_units(), row.source, None).
+    - If a row exists (spapi preferred, then manual): (available_units, row.source, None).
     - If no row: (0.0, None, "No inventory data found"). Caller should not crash; may attach warning.
     """
     row = get_inventory(db, sku, marketplace)
     if row is not None:
-        return (float(row.available_units()), row.source, None)
+        return (float(row.available_units), row.source, None)
     return (0.0, None, "No inventory data found")
 
 
-def _age_hours(ts: datetime) -> float:
-    """Age in hours from ts to now (>= 0)."""
-    now = datetime.now(timezone.utc)
+def _age_hours(ts: datetime, now: datetime | None = None) -> float:
+    """Age in hours from ts to now (>= 0); now defaults to the current UTC time."""
+    if now is None:
+        now = datetime.now(timezone.utc)
     if ts.tzinfo is None:
         ts = ts.replace(tzinfo=timezone.utc)
     delta = now - ts
     return max(0.0, delta.total_seconds() / 3600.0)
 
 
-def freshness_from_timestamp(ts: datetime | None) -> tuple[FreshnessStatus, float | None]:
+def freshness_from_timestamp(
+    ts: datetime | None, now: datetime | None = None
+) -> tuple[FreshnessStatus, float | None]:
     """
     Phase 11.4: Return (freshness_status, age_hours) for a timestamp.
     unknown + None when ts is None; otherwise fresh/warning/critical and age in hours.
     Uses INVENTORY_STALE_WARNING_HOURS and INVENTORY_STALE_CRITICAL_HOURS from config.
+    Pass now to age many timestamps against one clock reading (default: current UTC time).
     """
     if ts is None:
         return ("unknown", None)
-    age = _age_hours(ts)
+    age = _age_hours(ts, now)
     wh = getattr(settings, "inventory_stale_warning_hours", 24)
     ch = getattr(settings, "inventory_stale_critical_hours", 72)
     if age >= ch:
@@ -196,13 +229,14 @@ def freshness_from_timestamp(ts: datetime | None) -> tuple[FreshnessStatus, floa
     return ("fresh", round(age, 2))
 
 
-def freshness_days(updated_at: datetime) -> int:
-    """Floor of (now - updated_at) in days."""
-    now = datetime.now(timezone.utc)
+def freshness_days(updated_at: datetime, now: datetime | None = None) -> int:
+    """Floor of (now - updated_at) in days; now defaults to the current UTC time."""
+    if now is None:
+        now = datetime.now(timezone.utc)
     if updated_at.tzinfo is None:
         updated_at = updated_at.replace(tzinfo=timezone.utc)
-    delta = now - updated_at
-    return max(0, int(math.floor(delta.total_seconds() / 86400)))
+    # timedelta.days is already the floored whole-day count.
+    return max(0, (now - updated_at).days)
 
 
 def is_stale(freshness_days: int) -> bool:
@@ -8,11 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.schemas.data_quality import DataQuality
 from app.services.demand_source import get_demand_series_for_restock_sku
-from app.services.forecasting import (
-    _series_from_points,
-    backtest_30d,
-    seasonal_naive_weekly,
-)
+from app.services.forecasting import dense_history_array, snaive_backtest_and_forecast
 from app.services.timeseries import get_data_end_date_sku
 
 # History window for building the forecast (same as forecast SKU).
@@ -80,14 +76,14 @@ def compute_restock_plan(
     actual_list, meta = get_demand_series_for_restock_sku(
         db, sku, marketplace, start_date, end_date, include_unmapped=include_unmapped
     )
-    series = _series_from_points(actual_list)
-
-    if series.empty or len(series) < 8:
+    if len(actual_list) < 8:
         raise ValueError("Insufficient order history for this SKU to generate a restock plan")
 
-    # Daily forecast over lead_time_days (same model as forecast/sku)
-    forecast_series = seasonal_naive_weekly(series, lead_time_days)
-    avg_daily_demand = float(forecast_series.mean()) if forecast_series.notna().any() else 0.0
+    # Daily forecast over lead_time_days (same model as forecast/sku) and the Sprint 6
+    # backtest MAPE, both from one dense array of the zero-filled history.
+    units = dense_history_array(actual_list, start_date, end_date)
+    _, mape_30d, forecast_total = snaive_backtest_and_forecast(units, lead_time_days)
+    avg_daily_demand = forecast_total / lead_time_days if lead_time_days > 0 else 0.0
     avg_daily_demand = max(0.0, avg_daily_demand)
 
     # Days of cover, expected stockout date, stockout before lead time
@@ -101,9 +97,6 @@ def compute_restock_plan(
         expected_stockout_date = (date.today() + timedelta(days=days_int)).isoformat()
         stockout_before_lead_time = days_int < lead_time_days
 
-    # Backtest for MAPE (Sprint 6)
-    _, mape_30d, _ = backtest_30d(actual_list, use_seasonal_naive=True)
-
     # Lead-time demand (expected demand over lead time)
     lead_time_demand = avg_daily_demand * lead_time_days
 
@@ -7,11 +7,46 @@ from __future__ import annotations
 
 import math
 from datetime import date, datetime, timedelta
-from typing import Literal
+from typing import Literal, NamedTuple
 
 from app.schemas.restock_actions import DemandRangeDaily, RestockActionItem
 
 
+class _RestockNumbers(NamedTuple):
+    """Scalar results of the restock math; dates and dict packaging stay in compute_restock_action."""
+
+    days_of_cover_expected: float
+    days_of_cover_low: float
+    days_of_cover_high: float
+    days_until_stockout: int
+    suggested_reorder_qty_expected: float
+    suggested_reorder_qty_high: float
+
+
+def _restock_numbers(
+    lead_time_days: int,
+    current_stock_units: float,
+    daily_est: float,
+    daily_low: float,
+    daily_high: float,
+) -> _RestockNumbers:
+    """Days of cover, days until stockout and reorder quantities from daily demand (floats only)."""
+    eps = 1e-9
+    days_of_cover_expected = current_stock_units / max(daily_est, eps)
+    # Target: lead_time_days + 14 buffer
+    target_days = lead_time_days + 14
+    return _RestockNumbers(
+        days_of_cover_expected=days_of_cover_expected,
+        # Worst case: sells faster (high daily demand) -> fewer days of cover
+        days_of_cover_low=current_stock_units / max(daily_high, eps),
+        # Best case: sells slower (low daily demand) -> more days of cover
+        days_of_cover_high=current_stock_units / max(daily_low, eps),
+        days_until_stockout=math.ceil(days_of_cover_expected),
+        suggested_reorder_qty_expected=max(0.0, daily_est * target_days - current_stock_units),
+        suggested_reorder_qty_high=max(0.0, daily_high * target_days - current_stock_units),
+    )
+
+
 def compute_restock_action(
     *,
     sku: str | None,
@@ -84,26 +119,15 @@ def compute_restock_action(
             ],
         }
 
-    # Days of cover
-    eps = 1e-9
-    days_of_cover_expected = current_stock_units / max(daily_est, eps)
-    # Worst case: sells faster (high daily demand) -> fewer days of cover
-    days_of_cover_low = current_stock_units / max(daily_high, eps)
-    # Best case: sells slower (low daily demand) -> more days of cover
-    days_of_cover_high = current_stock_units / max(daily_low, eps)
+    nums = _restock_numbers(lead_time_days, current_stock_units, daily_est, daily_low, daily_high)
+    days_of_cover_expected = nums.days_of_cover_expected
+    suggested_reorder_qty_expected = nums.suggested_reorder_qty_expected
+    suggested_reorder_qty_high = nums.suggested_reorder_qty_high
 
     # Stockout and order-by
-    days_until_stockout = math.ceil(days_of_cover_expected)
-    stockout_date_expected = data_end_date + timedelta(days=days_until_stockout)
+    stockout_date_expected = data_end_date + timedelta(days=nums.days_until_stockout)
     order_by_date = stockout_date_expected - timedelta(days=lead_time_days)
 
-    # Target: lead_time_days + 14 buffer
-    target_days = lead_time_days + 14
-    target_units_expected = daily_est * target_days
-    suggested_reorder_qty_expected = max(0.0, target_units_expected - current_stock_units)
-    target_units_high = daily_high * target_days
-    suggested_reorder_qty_high = max(0.0, target_units_high - current_stock_units)
-
     # Status: urgent if doc <= lead_time + 3; watch if <= lead_time + 10; else healthy
     status: Literal["healthy", "watch", "urgent"] = "healthy"
     if days_of_cover_expected <= lead_time_days + 3:
@@ -152,8 +176,8 @@ def compute_restock_action(
         "daily_demand_estimate": round(daily_est, 4),
         "demand_range_daily": demand_range_daily,
         "days_of_cover_expected": round(days_of_cover_expected, 2),
-        "days_of_cover_low": round(days_of_cover_low, 2),
-        "days_of_cover_high": round(days_of_cover_high, 2),
+        "days_of_cover_low": round(nums.days_of_cover_low, 2),
+        "days_of_cover_high": round(nums.days_of_cover_high, 2),
         "stockout_date_expected": stockout_date_expected,
         "order_by_date": order_by_date,
         "suggested_reorder_qty_expected": round(suggested_reorder_qty_expected, 2),
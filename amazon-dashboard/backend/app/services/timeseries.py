@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
 
-from sqlalchemy import case, func, or_, select
+from sqlalchemy import case, func, lambda_stmt, or_, select, text, tuple_
 from sqlalchemy.orm import Session
 
+from app.models.daily_units import daily_units_mv
+from app.models.inventory import InventoryLevel
 from app.models.marketplace import Marketplace
 from app.models.order_item import OrderItem
 from app.models.product import Product
@@ -18,6 +22,7 @@ from app.schemas.sku_mapping import (
     SKU_MAPPING_STATUS_IGNORED,
     SKU_MAPPING_STATUS_PENDING,
 )
+from app.services.inventory_service import SOURCE_SPAPI
 
 logger = logging.getLogger(__name__)
 
@@ -35,16 +40,36 @@ class DemandMeta:
     discontinued_units: int
 
 
+_MV = daily_units_mv.c
+
+
+def _days(start: date, end: date) -> Iterator[date]:
+    """Every date from start to end inclusive (empty when end < start), via ordinals."""
+    return map(date.fromordinal, range(start.toordinal(), end.toordinal() + 1))
+
+
+def _densify(by_date: dict[date, int], start: date, end: date) -> list[tuple[date, int]]:
+    """Complete daily (date, units) series from start to end; days missing from by_date are 0."""
+    get = by_date.get
+    return [(d, get(d, 0)) for d in _days(start, end)]
+
+
+def refresh_daily_units(db: Session) -> None:
+    """
+    Refresh daily_units_mv after order_items change (orders sync bridge, seed).
+    CONCURRENTLY keeps readers unblocked; runs in the caller's transaction (caller commits).
+    """
+    db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY daily_units_mv"))
+
+
 def get_data_end_date_total(db: Session, marketplace_code: str) -> date | None:
     """
-    Return MAX(order_items.order_date) for total (optionally filtered by marketplace).
+    Return MAX(order_date) for total (optionally filtered by marketplace), from daily_units_mv.
     Returns None if no rows.
     """
-    q = select(func.max(OrderItem.order_date)).select_from(OrderItem)
+    q = lambda_stmt(lambda: select(func.max(_MV.order_date)))
     if marketplace_code != "ALL":
-        q = q.join(Marketplace, OrderItem.marketplace_id == Marketplace.id).where(
-            Marketplace.code == marketplace_code
-        )
+        q += lambda s: s.where(_MV.marketplace_code == marketplace_code)
     result = db.scalar(q)
     return result
 
@@ -53,18 +78,12 @@ def get_data_end_date_sku(
     db: Session, sku: str, marketplace_code: str
 ) -> date | None:
     """
-    Return MAX(order_items.order_date) for given sku (optionally filtered by marketplace).
+    Return MAX(order_date) for given sku (optionally filtered by marketplace), from daily_units_mv.
     Returns None if no rows.
     """
-    q = (
-        select(func.max(OrderItem.order_date))
-        .select_from(OrderItem)
-        .where(OrderItem.sku == sku)
-    )
+    q = lambda_stmt(lambda: select(func.max(_MV.order_date)).where(_MV.sku == sku))
     if marketplace_code != "ALL":
-        q = q.join(Marketplace, OrderItem.marketplace_id == Marketplace.id).where(
-            Marketplace.code == marketplace_code
-        )
+        q += lambda s: s.where(_MV.marketplace_code == marketplace_code)
     result = db.scalar(q)
     return result
 
@@ -76,7 +95,7 @@ def get_daily_units_total(
     marketplace: str,
 ) -> list[tuple[date, int]]:
     """
-    Aggregate SUM(order_items.units) per day over history range.
+    Aggregate units per day over history range from daily_units_mv (pre-summed order_items).
     If end_date is None, use get_data_end_date_total(); if still None, use date.today() and return empty-shaped series.
     Filter by marketplace if marketplace != "ALL".
     Return complete daily date range (fill missing days with 0).
@@ -85,23 +104,16 @@ def get_daily_units_total(
         end_date = get_data_end_date_total(db, marketplace)
     if end_date is None:
         end_date = date.today()
-    q = (
-        select(OrderItem.order_date, func.coalesce(func.sum(OrderItem.units), 0).label("units"))
-        .where(OrderItem.order_date >= start_date, OrderItem.order_date <= end_date)
-        .group_by(OrderItem.order_date)
+    q = lambda_stmt(
+        lambda: select(_MV.order_date, func.coalesce(func.sum(_MV.units), 0).label("units"))
+        .where(_MV.order_date >= start_date, _MV.order_date <= end_date)
+        .group_by(_MV.order_date)
     )
     if marketplace != "ALL":
-        q = q.join(Marketplace, OrderItem.marketplace_id == Marketplace.id).where(
-            Marketplace.code == marketplace
-        )
+        q += lambda s: s.where(_MV.marketplace_code == marketplace)
     rows = {row.order_date: int(row.units) for row in db.execute(q).all()}
 
-    out: list[tuple[date, int]] = []
-    d = start_date
-    while d <= end_date:
-        out.append((d, rows.get(d, 0)))
-        d += timedelta(days=1)
-    return out
+    return _densify(rows, start_date, end_date)
 
 
 def get_daily_units_by_sku(
@@ -112,7 +124,7 @@ def get_daily_units_by_sku(
     marketplace: str,
 ) -> list[tuple[date, int]]:
     """
-    Aggregate SUM(units) per day filtered by sku.
+    Aggregate units per day filtered by sku, from daily_units_mv.
     If end_date is None, use get_data_end_date_sku(); if still None, use date.today() and return empty-shaped series.
     Filter by marketplace if marketplace != "ALL".
     Return complete daily date range (fill missing days with 0).
@@ -121,26 +133,63 @@ def get_daily_units_by_sku(
         end_date = get_data_end_date_sku(db, sku, marketplace)
     if end_date is None:
         end_date = date.today()
-    q = (
-        select(OrderItem.order_date, func.coalesce(func.sum(OrderItem.units), 0).label("units"))
+    q = lambda_stmt(
+        lambda: select(_MV.order_date, func.coalesce(func.sum(_MV.units), 0).label("units"))
         .where(
-            OrderItem.sku == sku,
-            OrderItem.order_date >= start_date,
-            OrderItem.order_date <= end_date,
+            _MV.sku == sku,
+            _MV.order_date >= start_date,
+            _MV.order_date <= end_date,
         )
-        .group_by(OrderItem.order_date)
+        .group_by(_MV.order_date)
     )
     if marketplace != "ALL":
-        q = q.join(Marketplace, OrderItem.marketplace_id == Marketplace.id).where(
-            Marketplace.code == marketplace
-        )
+        q += lambda s: s.where(_MV.marketplace_code == marketplace)
     rows = {row.order_date: int(row.units) for row in db.execute(q).all()}
 
-    out: list[tuple[date, int]] = []
-    d = start_date
-    while d <= end_date:
-        out.append((d, rows.get(d, 0)))
-        d += timedelta(days=1)
+    return _densify(rows, start_date, end_date)
+
+
+def get_daily_units_bulk(
+    db: Session,
+    pairs: list[tuple[str, str]],
+    history_days: int,
+) -> dict[tuple[str, str], tuple[date, list[tuple[date, int]]]]:
+    """
+    Bulk get_data_end_date_sku + get_daily_units_by_sku for many (sku, marketplace_code) pairs
+    in one query on daily_units_mv. Each pair's window is the history_days ending at its own
+    MAX(order_date). Returns {(sku, marketplace): (end_date, zero-filled series)}; pairs with
+    no orders are omitted. Marketplace codes must be concrete (no "ALL").
+    """
+    if not pairs:
+        return {}
+    ends = (
+        select(_MV.sku, _MV.marketplace_code, func.max(_MV.order_date).label("end_date"))
+        .where(tuple_(_MV.sku, _MV.marketplace_code).in_(pairs))
+        .group_by(_MV.sku, _MV.marketplace_code)
+        .subquery()
+    )
+    q = (
+        select(_MV.sku, _MV.marketplace_code, ends.c.end_date, _MV.order_date, _MV.units)
+        .join(
+            ends,
+            (ends.c.sku == _MV.sku) & (ends.c.marketplace_code == _MV.marketplace_code),
+        )
+        .where(
+            _MV.order_date > ends.c.end_date - history_days,
+            _MV.order_date <= ends.c.end_date,
+        )
+    )
+    end_by_pair: dict[tuple[str, str], date] = {}
+    rows_by_pair: dict[tuple[str, str], dict[date, int]] = {}
+    for r in db.execute(q).all():
+        key = (r.sku, r.marketplace_code)
+        end_by_pair[key] = r.end_date
+        rows_by_pair.setdefault(key, {})[r.order_date] = int(r.units)
+
+    out: dict[tuple[str, str], tuple[date, list[tuple[date, int]]]] = {}
+    for key, end_date in end_by_pair.items():
+        start_date = end_date - timedelta(days=history_days - 1)
+        out[key] = (end_date, _densify(rows_by_pair[key], start_date, end_date))
     return out
 
 
@@ -222,8 +271,7 @@ def get_daily_units_total_mapped(
     excluded_total = ignored_total + discontinued_total
 
     out_mapped: list[tuple[date, int]] = []
-    d = start_date
-    while d <= end_date:
+    for d in _days(start_date, end_date):
         r = rows.get(d)
         if r is None:
             out_mapped.append((d, 0))
@@ -232,7 +280,6 @@ def get_daily_units_total_mapped(
             if include_unmapped:
                 inc += int(r.unmapped_units or 0)
             out_mapped.append((d, inc))
-        d += timedelta(days=1)
 
     meta = DemandMeta(
         excluded_units=excluded_total,
@@ -326,8 +373,7 @@ def get_daily_units_by_sku_mapped(
     unmapped_total = int(meta_row.unmapped_units or 0) if meta_row else 0
 
     out_list: list[tuple[date, int]] = []
-    d = start_date
-    while d <= end_date:
+    for d in _days(start_date, end_date):
         r = rows.get(d)
         if r is None:
             out_list.append((d, 0))
@@ -336,7 +382,6 @@ def get_daily_units_by_sku_mapped(
             if include_unmapped:
                 inc += int(r.unmapped_units or 0)
             out_list.append((d, inc))
-        d += timedelta(days=1)
 
     meta = DemandMeta(
         excluded_units=ignored_total + discontinued_total,
@@ -350,6 +395,286 @@ def get_daily_units_by_sku_mapped(
     return (out_list, meta)
 
 
+class SkuInventoryRow(NamedTuple):
+    """Best inventory_levels row for (sku, marketplace), as returned by fetch_sku_bundle."""
+
+    on_hand_units: float
+    reserved_units: float | None
+    available_units: float
+    as_of_at: datetime | None
+    updated_at: datetime
+
+
+class SkuBundle(NamedTuple):
+    """Everything the per-SKU restock path needs, fetched in one round-trip."""
+
+    marketplace_found: bool
+    end_date: date | None
+    series: list[tuple[date, int]]
+    meta: DemandMeta | None
+    inventory: SkuInventoryRow | None
+
+
+# One statement: marketplace check, MAX(order_date), mapped daily units over the history
+# window ending at that date, and the best inventory row (spapi first, then latest as_of_at).
+_SKU_BUNDLE_SQL = text(
+    """
+    WITH mp AS (
+        SELECT id FROM marketplaces WHERE code = :marketplace
+    ),
+    end_dt AS (
+        SELECT MAX(oi.order_date) AS end_date
+        FROM order_items oi
+        WHERE oi.sku = :sku
+          AND (:marketplace = 'ALL' OR oi.marketplace_id IN (SELECT id FROM mp))
+    ),
+    daily AS (
+        SELECT
+            oi.order_date,
+            SUM(CASE WHEN sm.status = :confirmed THEN oi.units ELSE 0 END) AS confirmed_units,
+            SUM(CASE WHEN sm.id IS NULL OR sm.status = :pending THEN oi.units ELSE 0 END) AS unmapped_units,
+            SUM(CASE WHEN sm.status = :ignored THEN oi.units ELSE 0 END) AS ignored_units,
+            SUM(CASE WHEN sm.status = :discontinued THEN oi.units ELSE 0 END) AS discontinued_units
+        FROM order_items oi
+        JOIN marketplaces m ON m.id = oi.marketplace_id
+        LEFT JOIN sku_mappings sm ON sm.sku = oi.sku AND sm.marketplace_code = m.code
+        CROSS JOIN end_dt
+        WHERE oi.sku = :sku
+          AND (:marketplace = 'ALL' OR m.code = :marketplace)
+          AND oi.order_date >= end_dt.end_date - CAST(:history_days AS integer) + 1
+          AND oi.order_date <= end_dt.end_date
+        GROUP BY oi.order_date
+    ),
+    inv AS (
+        SELECT on_hand_units, reserved_units, available_units, as_of_at, updated_at
+        FROM inventory_levels
+        WHERE sku = :sku AND marketplace = :marketplace
+        ORDER BY (source = 'spapi') DESC, as_of_at DESC NULLS LAST
+        LIMIT 1
+    )
+    SELECT
+        (:marketplace = 'ALL' OR EXISTS (SELECT 1 FROM mp)) AS marketplace_found,
+        (SELECT end_date FROM end_dt) AS end_date,
+        (
+            SELECT json_agg(
+                json_build_array(
+                    order_date, confirmed_units, unmapped_units, ignored_units, discontinued_units
+                )
+                ORDER BY order_date
+            )
+            FROM daily
+        ) AS daily,
+        inv.on_hand_units,
+        inv.reserved_units,
+        inv.available_units,
+        inv.as_of_at,
+        inv.updated_at
+    FROM (SELECT 1) AS one
+    LEFT JOIN inv ON TRUE
+    """
+)
+
+
+def fetch_sku_bundle(
+    db: Session,
+    sku: str,
+    marketplace: str,
+    history_days: int,
+    *,
+    include_unmapped: bool = False,
+) -> SkuBundle:
+    """
+    Single round-trip replacement for _validate_marketplace + get_data_end_date_sku +
+    get_daily_units_by_sku_mapped + get_inventory on the per-SKU restock path.
+
+    The series and meta follow get_daily_units_by_sku_mapped (confirmed only, plus
+    unmapped/pending when include_unmapped). series/meta are empty/None when the SKU
+    has no orders; inventory is None when marketplace is "ALL" or no row exists.
+    """
+    row = db.execute(
+        _SKU_BUNDLE_SQL,
+        {
+            "sku": sku,
+            "marketplace": marketplace,
+            "history_days": history_days,
+            "confirmed": SKU_MAPPING_STATUS_CONFIRMED,
+            "pending": SKU_MAPPING_STATUS_PENDING,
+            "ignored": SKU_MAPPING_STATUS_IGNORED,
+            "discontinued": SKU_MAPPING_STATUS_DISCONTINUED,
+        },
+    ).one()
+
+    inventory = (
+        SkuInventoryRow(
+            on_hand_units=row.on_hand_units,
+            reserved_units=row.reserved_units,
+            available_units=float(row.available_units),
+            as_of_at=row.as_of_at,
+            updated_at=row.updated_at,
+        )
+        if row.on_hand_units is not None
+        else None
+    )
+    end_date = row.end_date
+    if end_date is None:
+        return SkuBundle(bool(row.marketplace_found), None, [], None, inventory)
+
+    start_date = end_date - timedelta(days=history_days - 1)
+    by_date: dict[date, tuple[int, int]] = {}
+    unmapped_total = ignored_total = discontinued_total = 0
+    for d_str, confirmed, unmapped, ignored, discontinued in row.daily or []:
+        by_date[date.fromisoformat(d_str)] = (int(confirmed or 0), int(unmapped or 0))
+        unmapped_total += int(unmapped or 0)
+        ignored_total += int(ignored or 0)
+        discontinued_total += int(discontinued or 0)
+
+    series: list[tuple[date, int]] = []
+    for d in _days(start_date, end_date):
+        confirmed, unmapped = by_date.get(d, (0, 0))
+        series.append((d, confirmed + unmapped if include_unmapped else confirmed))
+
+    meta = DemandMeta(
+        excluded_units=ignored_total + discontinued_total,
+        excluded_rows=0,
+        excluded_skus=0,
+        unmapped_units=unmapped_total,
+        unmapped_skus=0,
+        ignored_units=ignored_total,
+        discontinued_units=discontinued_total,
+    )
+    return SkuBundle(bool(row.marketplace_found), end_date, series, meta, inventory)
+
+
+def fetch_sku_bundles(
+    db: Session,
+    skus: list[str],
+    marketplace: str,
+    history_days: int,
+    *,
+    include_unmapped: bool = False,
+) -> dict[str, SkuBundle]:
+    """
+    Bulk variant of fetch_sku_bundle for many SKUs: one query for every SKU's mapped daily
+    series (each over its own history window ending at its MAX(order_date)) and one query
+    for inventory. Caller validates the marketplace; marketplace_found is always True.
+    Returns a bundle for every requested SKU (end_date None when it has no orders).
+    """
+    if not skus:
+        return {}
+
+    end_q = (
+        select(OrderItem.sku, func.max(OrderItem.order_date).label("end_date"))
+        .where(OrderItem.sku.in_(skus))
+        .group_by(OrderItem.sku)
+    )
+    if marketplace != "ALL":
+        end_q = end_q.join(Marketplace, OrderItem.marketplace_id == Marketplace.id).where(
+            Marketplace.code == marketplace
+        )
+    ends = end_q.subquery()
+
+    confirmed_case = case((SkuMapping.status == SKU_MAPPING_STATUS_CONFIRMED, OrderItem.units), else_=0)
+    unmapped_case = case(
+        (SkuMapping.id.is_(None), OrderItem.units),
+        (SkuMapping.status == SKU_MAPPING_STATUS_PENDING, OrderItem.units),
+        else_=0,
+    )
+    ignored_case = case((SkuMapping.status == SKU_MAPPING_STATUS_IGNORED, OrderItem.units), else_=0)
+    discontinued_case = case((SkuMapping.status == SKU_MAPPING_STATUS_DISCONTINUED, OrderItem.units), else_=0)
+
+    q = (
+        select(
+            OrderItem.sku,
+            ends.c.end_date,
+            OrderItem.order_date,
+            func.sum(confirmed_case).label("confirmed_units"),
+            func.sum(unmapped_case).label("unmapped_units"),
+            func.sum(ignored_case).label("ignored_units"),
+            func.sum(discontinued_case).label("discontinued_units"),
+        )
+        .select_from(OrderItem)
+        .join(ends, ends.c.sku == OrderItem.sku)
+        .join(Marketplace, OrderItem.marketplace_id == Marketplace.id)
+        .outerjoin(
+            SkuMapping,
+            (OrderItem.sku == SkuMapping.sku) & (Marketplace.code == SkuMapping.marketplace_code),
+        )
+        .where(
+            OrderItem.order_date > ends.c.end_date - history_days,
+            OrderItem.order_date <= ends.c.end_date,
+        )
+        .group_by(OrderItem.sku, ends.c.end_date, OrderItem.order_date)
+    )
+    if marketplace != "ALL":
+        q = q.where(Marketplace.code == marketplace)
+
+    end_by_sku: dict[str, date] = {}
+    rows_by_sku: dict[str, dict[date, tuple[int, int]]] = {}
+    totals_by_sku: dict[str, list[int]] = {}
+    for r in db.execute(q).all():
+        end_by_sku[r.sku] = r.end_date
+        confirmed = int(r.confirmed_units or 0)
+        unmapped = int(r.unmapped_units or 0)
+        rows_by_sku.setdefault(r.sku, {})[r.order_date] = (confirmed, unmapped)
+        totals = totals_by_sku.setdefault(r.sku, [0, 0, 0])
+        totals[0] += unmapped
+        totals[1] += int(r.ignored_units or 0)
+        totals[2] += int(r.discontinued_units or 0)
+
+    inventory_by_sku: dict[str, SkuInventoryRow] = {}
+    if marketplace != "ALL":
+        inv_q = (
+            select(
+                InventoryLevel.sku,
+                InventoryLevel.on_hand_units,
+                InventoryLevel.reserved_units,
+                InventoryLevel.available_units,
+                InventoryLevel.as_of_at,
+                InventoryLevel.updated_at,
+            )
+            .where(InventoryLevel.sku.in_(skus), InventoryLevel.marketplace == marketplace)
+            .order_by(
+                InventoryLevel.sku,
+                (InventoryLevel.source == SOURCE_SPAPI).desc(),
+                InventoryLevel.as_of_at.desc().nulls_last(),
+            )
+        )
+        for r in db.execute(inv_q).all():
+            if r.sku not in inventory_by_sku:
+                inventory_by_sku[r.sku] = SkuInventoryRow(
+                    on_hand_units=r.on_hand_units,
+                    reserved_units=r.reserved_units,
+                    available_units=float(r.available_units),
+                    as_of_at=r.as_of_at,
+                    updated_at=r.updated_at,
+                )
+
+    out: dict[str, SkuBundle] = {}
+    for sku in skus:
+        inventory = inventory_by_sku.get(sku)
+        end_date = end_by_sku.get(sku)
+        if end_date is None:
+            out[sku] = SkuBundle(True, None, [], None, inventory)
+            continue
+        by_date = rows_by_sku[sku]
+        series: list[tuple[date, int]] = []
+        for d in _days(end_date - timedelta(days=history_days - 1), end_date):
+            confirmed, unmapped = by_date.get(d, (0, 0))
+            series.append((d, confirmed + unmapped if include_unmapped else confirmed))
+        unmapped_total, ignored_total, discontinued_total = totals_by_sku[sku]
+        meta = DemandMeta(
+            excluded_units=ignored_total + discontinued_total,
+            excluded_rows=0,
+            excluded_skus=0,
+            unmapped_units=unmapped_total,
+            unmapped_skus=0,
+            ignored_units=ignored_total,
+            discontinued_units=discontinued_total,
+        )
+        out[sku] = SkuBundle(True, end_date, series, meta, inventory)
+    return out
+
+
 def get_daily_units_by_product_mapped(
     db: Session,
     product_id: int,
@@ -442,8 +767,7 @@ def get_daily_units_by_product_mapped(
     unmapped_direct_total = int(meta_row.unmapped_direct or 0) if meta_row else 0
 
     out_list: list[tuple[date, int]] = []
-    d = start_date
-    while d <= end_date:
+    for d in _days(start_date, end_date):
         r = rows.get(d)
         if r is None:
             out_list.append((d, 0))
@@ -452,7 +776,6 @@ def get_daily_units_by_product_mapped(
             if include_unmapped:
                 inc += int(r.unmapped_direct_units or 0)
             out_list.append((d, inc))
-        d += timedelta(days=1)
 
     meta = DemandMeta(
         excluded_units=ignored_total + discontinued_total,
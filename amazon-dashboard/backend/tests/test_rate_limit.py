@@ -0,0 +1,48 @@
+"""Rate-limit keys: per-user buckets must differ between users."""
+from __future__ import annotations
+
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.middleware.rate_limit import _user_key
+
+
+def _request_with_token(token: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/dashboard/summary",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+    )
+
+
+def _token(subject: str) -> str:
+    return create_access_token(
+        subject=subject,
+        secret=settings.jwt_secret,
+        algorithm=settings.jwt_algorithm,
+        expires_minutes=settings.jwt_expires_minutes,
+    )
+
+
+def test_user_key_differs_between_users() -> None:
+    token_a, token_b = _token("1"), _token("2")
+    # The tokens share their leading characters (same JWT header), so a prefix key would collide.
+    assert token_a[:32] == token_b[:32]
+    key_a = _user_key(_request_with_token(token_a))
+    key_b = _user_key(_request_with_token(token_b))
+    assert key_a is not None and key_b is not None
+    assert key_a != key_b
+
+
+def test_user_key_stable_for_same_token() -> None:
+    token = _token("1")
+    assert _user_key(_request_with_token(token)) == _user_key(_request_with_token(token))
+
+
+def test_user_key_none_without_bearer() -> None:
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    assert _user_key(request) is None
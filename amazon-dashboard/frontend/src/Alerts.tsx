@@ -146,7 +146,10 @@ export default function Alerts({ token }: Props) {
     }
     runAlertsNow(token)
       .then((result) => {
-        showToast(`Created ${result.created} alert(s), emailed ${result.emailed}.`, "info");
+        showToast(
+          `Created ${result.created} alert(s), ${result.email_queued} email(s) queued to send.`,
+          "info"
+        );
         loadAlerts();
       })
       .catch((err: unknown) =>
@@ -517,7 +517,11 @@ export function acknowledgeAlerts(token: string, ids: number[]): Promise<{ ackno
   return request("POST", "/alerts/ack", token, { ids });
 }
 
-export function runAlertsNow(token: string): Promise<{ created: number; emailed: number }> {
+export function runAlertsNow(token: string): Promise<{
+  created: number;
+  emailed: number;
+  email_queued: number;
+}> {
   return request("POST", "/alerts/run", token);
 }
 
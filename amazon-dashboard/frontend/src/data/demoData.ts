@@ -799,7 +799,7 @@ export function acknowledgeDemoAlerts(ids: number[]): number {
   return count;
 }
 
-export function runDemoAlertsNow(): { created: number; emailed: number } {
+export function runDemoAlertsNow(): { created: number; emailed: number; email_queued: number } {
   // Add one demo alert when "Run now" is clicked (demo behavior)
   const created: AlertEventResponse = {
     id: demoAlertIdNext++,
@@ -814,7 +814,7 @@ export function runDemoAlertsNow(): { created: number; emailed: number } {
     created_at: new Date().toISOString(),
   };
   demoAlertsStore.unshift(created);
-  return { created: 1, emailed: 0 };
+  return { created: 1, emailed: 0, email_queued: 0 };
 }
 
 const demoAlertSettingsStore: AlertSettingsResponse = {